@@ -0,0 +1,10 @@
+"""
+MSL MCP Server 패키지
+
+MSL(Macro Scripting Language) 스크립트 파싱, 생성, 검증, 최적화, 설명 및
+예제 제공 기능을 MCP 도구로 제공하는 서버 패키지입니다.
+
+실행: python -m mslmcpserver.server
+"""
+
+__version__ = "1.0.0"
@@ -11,13 +11,57 @@ OpenAI GPT API를 이용한 MSL 스크립트 생성 및 분석 모듈
 import asyncio
 import json
 import logging
+import re
 from typing import Dict, List, Any, Optional, Tuple
+import httpx
 from openai import AsyncOpenAI
 import os
 from datetime import datetime
 
+try:
+    import h2  # noqa: F401  (httpx의 HTTP/2 지원에 필요)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# MSL 생성/분석에 사용하는 OpenAI 모델 (생성 결과 캐시 키에도 포함됩니다)
+OPENAI_MODEL = "gpt-4o"
+
+# MSL 생성 응답 형식 안내 (모든 생성 요청에서 동일한 프롬프트 접두부로 사용)
+MSL_GENERATION_FORMAT_PROMPT = """
+요청을 MSL 스크립트로 변환할 때는 다음 JSON 형식으로만 응답하세요:
+{
+    "msl_script": "생성된 MSL 스크립트",
+    "description": "스크립트 설명",
+    "complexity": "간단/보통/복잡",
+    "estimated_duration": "예상 실행 시간 (ms)",
+    "optimization_suggestions": ["최적화 제안 목록"],
+    "safety_notes": ["안전성 주의사항"],
+    "game_context": "적용 가능한 게임 상황"
+}
+"""
+
+# OpenAI API 연결 풀 설정 (동시 요청이 연결과 TLS 세션을 재사용합니다)
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# openai 라이브러리 기본값과 같은 타임아웃 (사용자 지정 클라이언트는 기본값을 물려받지 않음)
+OPENAI_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """OpenAI 클라이언트가 사용할 HTTP 클라이언트를 만듭니다 (h2가 설치되어 있으면 HTTP/2)."""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=OPENAI_HTTP_LIMITS,
+        timeout=OPENAI_HTTP_TIMEOUT,
+        follow_redirects=True
+    )
+
+
+# 생성 응답에서 완성된 "msl_script" 문자열 값 (JSON 이스케이프 포함)
+MSL_SCRIPT_FIELD_RE = re.compile(r'"msl_script"\s*:\s*("(?:[^"\\]|\\.)*")')
+
 class OpenAIIntegration:
     """OpenAI GPT API를 이용한 MSL 지원 클래스"""
     
@@ -32,8 +76,9 @@ class OpenAIIntegration:
         if not self.api_key:
             raise ValueError("OpenAI API 키가 필요합니다. 환경변수 OPENAI_API_KEY를 설정하거나 직접 제공하세요.")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
-        self.model = "gpt-4o"  # 최신 모델 사용
+        # 싱글톤 인스턴스가 프로세스 전체에서 하나의 연결 풀을 공유합니다
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=_build_http_client())
+        self.model = OPENAI_MODEL
         
         # MSL 언어 기본 정보
         self.msl_system_prompt = self._build_msl_system_prompt()
@@ -95,32 +140,11 @@ class OpenAIIntegration:
             생성된 MSL 스크립트와 메타데이터
         """
         try:
-            user_prompt = f"""
-다음 요청을 MSL 스크립트로 변환해주세요:
-
-요청: {prompt}
-
-응답 형식:
-{{
-    "msl_script": "생성된 MSL 스크립트",
-    "description": "스크립트 설명",
-    "complexity": "간단/보통/복잡",
-    "estimated_duration": "예상 실행 시간 (ms)",
-    "optimization_suggestions": ["최적화 제안 목록"],
-    "safety_notes": ["안전성 주의사항"],
-    "game_context": "적용 가능한 게임 상황"
-}}
-"""
-            
-            if context:
-                user_prompt += f"\n\n추가 컨텍스트: {json.dumps(context, ensure_ascii=False, indent=2)}"
+            messages = self._build_generation_messages(prompt, context)
             
             response = await self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": self.msl_system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=messages,
                 temperature=0.7,
                 max_tokens=1000
             )
@@ -149,6 +173,88 @@ class OpenAIIntegration:
                 "generated_at": datetime.now().isoformat()
             }
 
+    async def generate_msl_script_streaming(self, prompt: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        자연어 프롬프트로부터 MSL 스크립트만 생성 (스트리밍)
+        
+        응답 JSON의 첫 필드인 "msl_script" 값이 완성되면 나머지(설명, 제안 등)를
+        기다리지 않고 스트림을 닫습니다. 스크립트만 필요한 호출자를 위한 경로입니다.
+        
+        Args:
+            prompt: 자연어 요청
+            context: 추가 컨텍스트 정보
+            
+        Returns:
+            {"msl_script": ...} 또는 실패 시 "error"가 포함된 딕셔너리
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_generation_messages(prompt, context),
+                temperature=0.7,
+                max_tokens=1000,
+                stream=True
+            )
+            
+            chunks: List[str] = []
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    chunks.append(delta)
+                    
+                    # 닫는 따옴표가 들어올 수 있는 조각에서만 값 완성 여부를 확인합니다
+                    if '"' in delta:
+                        match = MSL_SCRIPT_FIELD_RE.search("".join(chunks))
+                        if match:
+                            return {
+                                "msl_script": json.loads(match.group(1)),
+                                "generated_at": datetime.now().isoformat(),
+                                "model_used": self.model
+                            }
+            finally:
+                await stream.close()
+            
+            # 스트림이 끝날 때까지 스크립트 필드를 찾지 못함
+            content = "".join(chunks)
+            logger.warning(f"MSL 스트리밍 응답에서 스크립트를 찾지 못했습니다: {content[:200]}")
+            return {
+                "error": "응답에서 MSL 스크립트를 찾지 못했습니다.",
+                "msl_script": "",
+                "generated_at": datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"MSL 스트리밍 생성 중 오류: {e}")
+            return {
+                "error": str(e),
+                "msl_script": "",
+                "generated_at": datetime.now().isoformat()
+            }
+    
+    def _build_generation_messages(self, prompt: str, context: Optional[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """MSL 생성 요청 메시지를 구성합니다"""
+        # 프롬프트 캐시를 활용하도록 고정된 내용(시스템 프롬프트, 응답 형식, 컨텍스트)을
+        # 앞에 두고 매 요청마다 달라지는 사용자 요청은 마지막에 둡니다.
+        messages = [
+            {"role": "system", "content": self.msl_system_prompt},
+            {"role": "system", "content": MSL_GENERATION_FORMAT_PROMPT}
+        ]
+        
+        if context:
+            # 키 순서를 고정하여 같은 컨텍스트는 항상 같은 바이트열이 되도록 합니다
+            context_json = json.dumps(context, ensure_ascii=False, indent=2, sort_keys=True)
+            messages.append({"role": "system", "content": f"추가 컨텍스트: {context_json}"})
+        
+        messages.append({
+            "role": "user",
+            "content": f"다음 요청을 MSL 스크립트로 변환해주세요:\n\n요청: {prompt}"
+        })
+        return messages
+
     async def optimize_msl_script(self, msl_script: str, optimization_level: str = "standard") -> Dict[str, Any]:
         """
         MSL 스크립트 최적화 제안 생성
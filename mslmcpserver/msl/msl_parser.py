@@ -21,10 +21,23 @@ Lexer가 생성한 토큰을 받아서 AST(Abstract Syntax Tree)로 변환합니
 
 import re
 from typing import List, Optional, Union, Dict
-from .msl_lexer import MSLLexer, Token, TokenType
+from .msl_lexer import LexerError, MSLLexer, Token, TokenType
 from .msl_ast import *
 
 
+# 구문 분석 전에 걸러내는 토큰 타입
+IGNORED_TOKEN_TYPES = frozenset((TokenType.COMMENT, TokenType.WHITESPACE, TokenType.NEWLINE))
+
+# 마우스 좌표 토큰 값: @(x,y)
+_MOUSE_COORD_RE = re.compile(r'@\(\s*(-?\d+)\s*,\s*(-?\d+)\s*\)')
+
+# 휠 토큰 값 → 휠 방향
+WHEEL_DIRECTIONS = {
+    'wheel_up': '+',
+    'wheel_down': '-',
+}
+
+
 class ParseError(Exception):
     """MSL 파싱 오류 - 구문 분석 중 발생하는 오류를 처리합니다"""
     
@@ -76,17 +89,17 @@ class MSLParser:
             >>> # SequentialNode with KeyNode and DelayNode
         """
         # 1. 토큰화
-        lexer = MSLLexer()
-        self.tokens = lexer.tokenize(text)
+        self.tokens = MSLLexer(text).tokenize()
         
-        # 2. 주석 및 공백 제거 - 파싱에 불필요한 토큰 제거
+        # 2. 주석, 공백, 줄바꿈 제거 - 파싱에 불필요한 토큰 제거
         self.tokens = [token for token in self.tokens 
-                      if token.type not in [TokenType.COMMENT, TokenType.WHITESPACE]]
+                      if token.type not in IGNORED_TOKEN_TYPES]
         
-        # 3. 토큰 유효성 검사
-        errors = lexer.validate_tokens(self.tokens)
-        if errors:
-            raise ParseError(f"토큰 오류: {', '.join(errors)}")
+        # 3. 토큰 유효성 검사 - 어휘분석기가 인식하지 못한 문자
+        unknown_tokens = [token for token in self.tokens if token.type == TokenType.UNKNOWN]
+        if unknown_tokens:
+            errors = [f"알 수 없는 토큰 '{token.value}' ({token.line}:{token.column})" for token in unknown_tokens]
+            raise ParseError(f"토큰 오류: {', '.join(errors)}", unknown_tokens[0])
         
         # 4. 파싱 초기화
         self.current_position = 0
@@ -108,6 +121,22 @@ class MSLParser:
         except IndexError:
             raise ParseError("예상치 못한 스크립트 끝")
     
+    def try_parse(self, text: str) -> Optional[MSLNode]:
+        """
+        MSL 스크립트를 파싱하되, 구문/어휘 오류가 있으면 예외 대신 None을 반환합니다.
+        유효성만 확인하는 호출부가 직접 예외를 처리하지 않아도 되도록 합니다.
+        
+        Args:
+            text (str): MSL 스크립트 텍스트
+            
+        Returns:
+            Optional[MSLNode]: 루트 AST 노드 (오류가 있으면 None)
+        """
+        try:
+            return self.parse(text)
+        except (ParseError, LexerError):
+            return None
+    
     def advance(self) -> Optional[Token]:
         """다음 토큰으로 이동합니다"""
         if self.current_position < len(self.tokens) - 1:
@@ -149,11 +178,11 @@ class MSLParser:
         """순차 실행 파싱 (가장 낮은 우선순위: ,) - W,A,S,D"""
         left = self.parse_simultaneous()
         
-        if self.match(TokenType.SEQUENTIAL):
+        if self.match(TokenType.COMMA):
             sequential_node = SequentialNode(self._get_position())
             sequential_node.add_child(left)
             
-            while self.match(TokenType.SEQUENTIAL):
+            while self.match(TokenType.COMMA):
                 self.advance()  # , 소비
                 right = self.parse_simultaneous()
                 sequential_node.add_child(right)
@@ -166,11 +195,11 @@ class MSLParser:
         """동시 실행 파싱 (+) - Ctrl+C"""
         left = self.parse_parallel()
         
-        if self.match(TokenType.SIMULTANEOUS):
+        if self.match(TokenType.PLUS):
             simultaneous_node = SimultaneousNode(self._get_position())
             simultaneous_node.add_child(left)
             
-            while self.match(TokenType.SIMULTANEOUS):
+            while self.match(TokenType.PLUS):
                 self.advance()  # + 소비
                 right = self.parse_parallel()
                 simultaneous_node.add_child(right)
@@ -183,11 +212,11 @@ class MSLParser:
         """병렬 실행 파싱 (|) - (W,A)|(S,D)"""
         left = self.parse_hold_chain()
         
-        if self.match(TokenType.PARALLEL):
+        if self.match(TokenType.PIPE):
             parallel_node = ParallelNode(self._get_position())
             parallel_node.add_child(left)
             
-            while self.match(TokenType.PARALLEL):
+            while self.match(TokenType.PIPE):
                 self.advance()  # | 소비
                 right = self.parse_hold_chain()
                 parallel_node.add_child(right)
@@ -200,11 +229,11 @@ class MSLParser:
         """홀드 연결 파싱 (>) - W>A>S"""
         left = self.parse_continuous()
         
-        if self.match(TokenType.HOLD_CHAIN):
+        if self.match(TokenType.GREATER):
             hold_chain_node = HoldChainNode(self._get_position())
             hold_chain_node.add_child(left)
             
-            while self.match(TokenType.HOLD_CHAIN):
+            while self.match(TokenType.GREATER):
                 self.advance()  # > 소비
                 right = self.parse_continuous()
                 hold_chain_node.add_child(right)
@@ -217,19 +246,18 @@ class MSLParser:
         """연속 입력 파싱 (&) - Space&1000"""
         left = self.parse_repeat()
         
-        if self.match(TokenType.CONTINUOUS):
+        if self.match(TokenType.AMPERSAND):
             self.advance()  # & 소비
             
             # 연속 시간 파싱
             if not self.match(TokenType.NUMBER):
                 raise ParseError("연속 입력(&) 뒤에는 시간(숫자)이 와야 합니다", self.current_token)
             
-            duration_token = self.expect(TokenType.NUMBER)
-            duration = float(duration_token.value)
+            interval_token = self.expect(TokenType.NUMBER)
+            interval = int(float(interval_token.value))
             
-            continuous_node = ContinuousNode(self._get_position())
+            continuous_node = ContinuousNode(interval, self._get_position())
             continuous_node.add_child(left)
-            continuous_node.duration = duration
             
             return continuous_node
         
@@ -239,7 +267,7 @@ class MSLParser:
         """반복 파싱 (*) - W*5"""
         left = self.parse_toggle()
         
-        if self.match(TokenType.REPEAT):
+        if self.match(TokenType.STAR):
             self.advance()  # * 소비
             
             # 반복 횟수 파싱
@@ -249,22 +277,24 @@ class MSLParser:
             count_token = self.expect(TokenType.NUMBER)
             count = int(float(count_token.value))  # 소수점도 처리하되 정수로 변환
             
-            repeat_node = RepeatNode(self._get_position())
+            repeat_node = RepeatNode(count, self._get_position())
             repeat_node.add_child(left)
-            repeat_node.count = count
             
             # 반복 간격 파싱 {숫자}
-            if self.match(TokenType.INTERVAL_START):
+            if self.match(TokenType.LBRACE):
                 self.advance()  # { 소비
                 
                 if not self.match(TokenType.NUMBER):
                     raise ParseError("반복 간격({) 뒤에는 시간(숫자)이 와야 합니다", self.current_token)
                 
                 interval_token = self.expect(TokenType.NUMBER)
-                interval = float(interval_token.value)
-                repeat_node.interval = interval
+                interval = int(float(interval_token.value))
+                
+                self.expect(TokenType.RBRACE)  # } 소비
                 
-                self.expect(TokenType.INTERVAL_END)  # } 소비
+                # 간격 정보를 RepeatNode에 추가
+                interval_node = IntervalNode(interval, self._get_position())
+                repeat_node.add_child(interval_node)
             
             return repeat_node
         
@@ -272,7 +302,7 @@ class MSLParser:
     
     def parse_toggle(self) -> MSLNode:
         """토글 파싱 (~) - ~CapsLock"""
-        if self.match(TokenType.TOGGLE):
+        if self.match(TokenType.TILDE):
             self.advance()  # ~ 소비
             
             base_node = self.parse_primary()
@@ -290,14 +320,13 @@ class MSLParser:
             raise ParseError("예상치 못한 스크립트 끝")
         
         # 그룹 처리 (...)
-        if self.match(TokenType.DELAY_START):
+        if self.match(TokenType.LPAREN):
             return self.parse_group()
         
         # 키 노드
         elif self.match(TokenType.KEY):
             key_token = self.expect(TokenType.KEY)
-            key_node = KeyNode(self._get_position(key_token))
-            key_node.key = key_token.value
+            key_node = KeyNode(key_token.value, self._get_position(key_token))
             
             # 타이밍 수정자 확인
             return self.parse_timing_modifiers(key_node)
@@ -305,131 +334,103 @@ class MSLParser:
         # 변수 노드
         elif self.match(TokenType.VARIABLE):
             var_token = self.expect(TokenType.VARIABLE)
-            var_node = VariableNode(self._get_position(var_token))
-            var_node.name = var_token.value[1:]  # $ 제거
-            
-            return var_node
+            # 어휘분석기가 이미 $를 제거한 이름을 넘겨줍니다
+            return VariableNode(var_token.value, self._get_position(var_token))
         
         # 마우스 좌표 노드
         elif self.match(TokenType.MOUSE_COORD):
             coord_token = self.expect(TokenType.MOUSE_COORD)
             
             # @(x,y) 파싱
-            coord_str = coord_token.value[2:-1]  # @( 와 ) 제거
-            x_str, y_str = coord_str.split(',')
-            x = int(x_str.strip())
-            y = int(y_str.strip())
-            
-            mouse_node = MouseNode(self._get_position(coord_token))
-            mouse_node.x = x
-            mouse_node.y = y
+            match = _MOUSE_COORD_RE.match(coord_token.value)
+            if not match:
+                raise ParseError(f"잘못된 마우스 좌표 형식: {coord_token.value}", coord_token)
             
-            return mouse_node
+            x, y = int(match.group(1)), int(match.group(2))
+            return MouseCoordNode(x, y, self._get_position(coord_token))
         
         # 휠 노드
         elif self.match(TokenType.WHEEL):
             wheel_token = self.expect(TokenType.WHEEL)
             
-            # wheel+3 또는 wheel-2 파싱
-            wheel_str = wheel_token.value
-            direction = 1 if '+' in wheel_str else -1
-            amount_str = wheel_str.split('+' if '+' in wheel_str else '-')[1]
-            amount = int(amount_str) if amount_str else 1
-            
-            wheel_node = WheelNode(self._get_position(wheel_token))
-            wheel_node.direction = direction
-            wheel_node.amount = amount
-            
-            return wheel_node
+            # wheel_up / wheel_down 한 칸 (여러 칸은 wheel_up*3처럼 반복으로 표현)
+            direction = WHEEL_DIRECTIONS[wheel_token.value]
+            return WheelNode(direction, 1, self._get_position(wheel_token))
         
         # 숫자 노드 (단독으로 사용되는 경우)
         elif self.match(TokenType.NUMBER):
             number_token = self.expect(TokenType.NUMBER)
-            number_node = NumberNode(self._get_position(number_token))
-            number_node.value = float(number_token.value)
-            
-            return number_node
+            return NumberNode(float(number_token.value), self._get_position(number_token))
         
         else:
             raise ParseError(f"예상치 못한 토큰: {self.current_token.value}", self.current_token)
     
     def parse_group(self) -> MSLNode:
-        """그룹 파싱 (...) - 괄호로 묶인 표현식"""
-        self.expect(TokenType.DELAY_START)  # ( 소비
+        """그룹 파싱 (...) - 괄호로 묶인 표현식 또는 단독 지연 시간"""
+        group_token = self.expect(TokenType.LPAREN)  # ( 소비
         
         # 그룹 내부 표현식 파싱
         inner_expr = self.parse_expression()
         
-        self.expect(TokenType.DELAY_END)  # ) 소비
+        self.expect(TokenType.RPAREN)  # ) 소비
+        
+        # 숫자만 있는 괄호는 단독 지연 시간 - Q,(500),W
+        if isinstance(inner_expr, NumberNode):
+            return DelayNode(int(inner_expr.number), self._get_position(group_token))
+        
+        # 그룹 노드로 감싸기
+        group_node = GroupNode(self._get_position())
+        group_node.add_child(inner_expr)
         
-        return inner_expr
+        return group_node
     
     def parse_timing_modifiers(self, base_node: MSLNode) -> MSLNode:
-        """타이밍 수정자 파싱 - 키 뒤에 오는 지연, 홀드 등"""
+        """타이밍 수정자 파싱 - 키 뒤에 오는 지연, 홀드, 페이드 (여러 개 연속 가능)"""
         result = base_node
         
-        # 지연 시간 (숫자) - W(500)
-        if self.match(TokenType.DELAY_START):
-            self.advance()  # ( 소비
+        while True:
+            # 지연 시간 (숫자) - W(500)
+            if self.match(TokenType.LPAREN):
+                delay = self._parse_timing_value(TokenType.RPAREN, "지연 시간 괄호 안에는 숫자가 와야 합니다")
+                timing_node = DelayNode(delay, self._get_position())
             
-            if not self.match(TokenType.NUMBER):
-                raise ParseError("지연 시간 괄호 안에는 숫자가 와야 합니다", self.current_token)
+            # 홀드 시간 [숫자] - W[1000]
+            elif self.match(TokenType.LBRACKET):
+                hold_time = self._parse_timing_value(TokenType.RBRACKET, "홀드 시간 괄호 안에는 숫자가 와야 합니다")
+                timing_node = HoldNode(hold_time, self._get_position())
             
-            delay_token = self.expect(TokenType.NUMBER)
-            delay = float(delay_token.value)
+            # 페이드 시간 <숫자> - W<500> (닫는 '>'는 어휘분석기가 GREATER로 넘겨줍니다)
+            elif self.match(TokenType.LANGLE):
+                fade_time = self._parse_timing_value(TokenType.GREATER, "페이드 시간 괄호 안에는 숫자가 와야 합니다")
+                timing_node = FadeNode(fade_time, self._get_position())
             
-            self.expect(TokenType.DELAY_END)  # ) 소비
+            else:
+                return result
             
-            delay_node = DelayNode(self._get_position())
-            delay_node.add_child(result)
-            delay_node.duration = delay
-            result = delay_node
+            timing_node.add_child(result)
+            result = timing_node
+    
+    def _parse_timing_value(self, end_type: TokenType, message: str) -> int:
+        """여는 괄호, 숫자(ms), 닫는 괄호를 소비하고 시간 값을 반환합니다"""
+        self.advance()  # 여는 괄호 소비
         
-        # 홀드 시간 [숫자] - W[1000]
-        if self.match(TokenType.HOLD_START):
-            self.advance()  # [ 소비
-            
-            if not self.match(TokenType.NUMBER):
-                raise ParseError("홀드 시간 괄호 안에는 숫자가 와야 합니다", self.current_token)
-            
-            hold_token = self.expect(TokenType.NUMBER)
-            hold_duration = float(hold_token.value)
-            
-            self.expect(TokenType.HOLD_END)  # ] 소비
-            
-            hold_node = HoldNode(self._get_position())
-            hold_node.add_child(result)
-            hold_node.duration = hold_duration
-            result = hold_node
+        if not self.match(TokenType.NUMBER):
+            raise ParseError(message, self.current_token)
         
-        # 페이드 시간 <숫자> - W<500>
-        if self.match(TokenType.FADE_START):
-            self.advance()  # < 소비
-            
-            if not self.match(TokenType.NUMBER):
-                raise ParseError("페이드 시간 괄호 안에는 숫자가 와야 합니다", self.current_token)
-            
-            fade_token = self.expect(TokenType.NUMBER)
-            fade_duration = float(fade_token.value)
-            
-            # fade end는 '>' 인데 이미 HOLD_CHAIN으로 사용되므로 특별 처리
-            # 실제로는 구문 분석에서 처리가 복잡할 수 있으므로 일단 간단히 처리
-            
-            fade_node = FadeNode(self._get_position())
-            fade_node.add_child(result)
-            fade_node.duration = fade_duration
-            result = fade_node
+        value_token = self.expect(TokenType.NUMBER)
+        self.expect(end_type)  # 닫는 괄호 소비
         
-        return result
+        return int(float(value_token.value))
     
     def _get_position(self, token: Optional[Token] = None) -> Position:
         """현재 위치 정보 생성"""
+        if token is None:
+            token = self.current_token
+        
         if token:
-            return Position(token.line, token.column)
-        elif self.current_token:
-            return Position(self.current_token.line, self.current_token.column)
+            return Position(token.line, token.column, token.position)
         else:
-            return Position(1, 1)
+            return Position(1, 1, 0)
     
     def analyze_syntax(self, text: str) -> Dict[str, any]:
         """
@@ -508,7 +509,7 @@ def demo_parser():
         ("게임 콤보", "Q(100)W(150)E(200)R"),
         ("복합 매크로", "Shift[2000]+(W,A,S,D)"),
         ("마우스 제어", "@(100,200)"),
-        ("휠 제어", "wheel+3"),
+        ("휠 제어", "wheel_up*3"),
         ("변수 사용", "$combo1"),
         
         # 복잡한 구조
@@ -10,214 +10,367 @@ MSL MCP Server - 게이머를 위한 매크로 스크립팅 언어 도우미
 """
 
 import asyncio
+import json
 import logging
+import os
+import sys
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 # MSL 도구들 임포트
-from tools.parse_tool import ParseMSLTool
-from tools.generate_tool import GenerateMSLTool
-from tools.validate_tool import ValidateMSLTool
-from tools.optimize_tool import OptimizeMSLTool
-from tools.explain_tool import ExplainMSLTool
-from tools.examples_tool import ExamplesMSLTool
-
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+from mslmcpserver.tools import (
+    ParseMSLTool,
+    GenerateMSLTool,
+    ValidateMSLTool,
+    OptimizeMSLTool,
+    ExplainMSLTool,
+    ExamplesMSLTool,
+)
+
+# 로깅 설정 (기본 WARNING, 디버깅 시 MSL_LOG_LEVEL 환경변수로 조정)
+logging.basicConfig(level=os.environ.get("MSL_LOG_LEVEL", "WARNING").upper())
 logger = logging.getLogger("msl-mcp-server")
 
 # MCP 서버 인스턴스 생성
 server = Server("msl-assistant")
 
-# MSL 도구 인스턴스들
-parse_tool = ParseMSLTool()
-generate_tool = GenerateMSLTool()
-validate_tool = ValidateMSLTool()
-optimize_tool = OptimizeMSLTool()
-explain_tool = ExplainMSLTool()
-examples_tool = ExamplesMSLTool()
+# 도구 이름 → 도구 클래스 매핑 (인스턴스는 처음 호출될 때 생성합니다)
+TOOL_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "parse_msl": ParseMSLTool,
+    "generate_msl": GenerateMSLTool,
+    "validate_msl": ValidateMSLTool,
+    "optimize_msl": OptimizeMSLTool,
+    "explain_msl": ExplainMSLTool,
+    "msl_examples": ExamplesMSLTool,
+}
+_tool_instances: Dict[str, Any] = {}
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
+def _get_tool(name: str) -> Optional[Any]:
     """
-    사용 가능한 MSL 도구 목록을 반환합니다.
+    도구 인스턴스를 반환합니다. 처음 요청된 도구만 생성하므로 서버 시작 비용이 줄어듭니다.
     
     Returns:
-        list[Tool]: 6개 MSL 도구의 정의 목록
+        Optional[Any]: 도구 인스턴스 (알 수 없는 도구이면 None)
+    """
+    tool = _tool_instances.get(name)
+    if tool is None:
+        factory = TOOL_FACTORIES.get(name)
+        if factory is None:
+            return None
+        tool = _tool_instances[name] = factory()
+    return tool
+
+
+# 동일한 인자에 대해 항상 같은 결과를 반환하는 도구들의 결과 캐시 (LRU)
+# generate_msl은 AI 응답에 따라 결과가 달라지므로 캐시하지 않습니다.
+CACHEABLE_TOOLS = frozenset({
+    "parse_msl",
+    "validate_msl",
+    "optimize_msl",
+    "explain_msl",
+    "msl_examples",
+})
+RESULT_CACHE_MAX_SIZE = 1024
+_result_cache: "OrderedDict[Tuple[str, str], list[TextContent]]" = OrderedDict()
+
+# 실행 중인 캐시 대상 요청 (같은 요청이 동시에 들어오면 결과를 공유합니다)
+_pending_results: "Dict[Tuple[str, str], asyncio.Future[list[TextContent]]]" = {}
+
+# 공유 응답 객체 (읽기 전용으로만 사용합니다)
+_EMPTY_RESULT: list[TextContent] = []
+
+
+def _make_cache_key(name: str, arguments: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """
+    도구 이름과 정규화된 인자로 캐시 키를 생성합니다.
+    
+    Returns:
+        Optional[Tuple[str, str]]: 캐시 키 (인자를 JSON으로 직렬화할 수 없으면 None)
     """
-    return [
-        Tool(
-            name="parse_msl",
-            description="MSL 스크립트를 파싱하고 AST 구조를 분석합니다. 구문 오류를 검출하고 토큰 분석 결과를 제공합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "분석할 MSL 스크립트 코드"
-                    },
-                    "detailed": {
-                        "type": "boolean", 
-                        "description": "상세한 AST 및 토큰 정보 포함 여부",
-                        "default": False
-                    }
-                },
-                "required": ["script"]
+    try:
+        return name, json.dumps(arguments or {}, sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_cached_result(key: Tuple[str, str]) -> Optional[list[TextContent]]:
+    """캐시된 결과를 반환하고 가장 최근에 사용한 항목으로 표시합니다."""
+    result = _result_cache.get(key)
+    if result is not None:
+        _result_cache.move_to_end(key)
+    return result
+
+
+def _store_cached_result(key: Tuple[str, str], result: list[TextContent]):
+    """결과를 캐시에 저장합니다. 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+    _result_cache[key] = result
+    _result_cache.move_to_end(key)
+    if len(_result_cache) > RESULT_CACHE_MAX_SIZE:
+        _result_cache.popitem(last=False)
+
+
+# MCP 클라이언트에 노출하는 도구 정의 (불변 스키마이므로 임포트 시 한 번만 생성)
+PARSE_MSL_TOOL = Tool(
+    name="parse_msl",
+    description="MSL 스크립트를 파싱하고 AST 구조를 분석합니다. 구문 오류를 검출하고 토큰 분석 결과를 제공합니다.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "script": {
+                "type": "string",
+                "description": "분석할 MSL 스크립트 코드"
+            },
+            "detailed": {
+                "type": "boolean", 
+                "description": "상세한 AST 및 토큰 정보 포함 여부",
+                "default": False
             }
-        ),
-        Tool(
-            name="generate_msl",
-            description="자연어 설명을 바탕으로 MSL 스크립트를 자동 생성합니다. Context7를 활용하여 게임별 최적화된 스크립트를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "prompt": {
-                        "type": "string",
-                        "description": "원하는 매크로 동작을 설명하는 자연어 프롬프트"
-                    },
-                    "game_type": {
-                        "type": "string",
-                        "description": "게임 타입 (fps, mmo, rts, moba, general)",
-                        "default": "general"
-                    },
-                    "complexity": {
-                        "type": "string",
-                        "description": "스크립트 복잡도 (simple, medium, complex)",
-                        "default": "medium"
-                    }
-                },
-                "required": ["prompt"]
+        },
+        "required": ["script"]
+    }
+)
+
+GENERATE_MSL_TOOL = Tool(
+    name="generate_msl",
+    description="자연어 설명을 바탕으로 MSL 스크립트를 자동 생성합니다. Context7를 활용하여 게임별 최적화된 스크립트를 생성합니다.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "prompt": {
+                "type": "string",
+                "description": "원하는 매크로 동작을 설명하는 자연어 프롬프트"
+            },
+            "game_type": {
+                "type": "string",
+                "description": "게임 타입 (fps, mmo, rts, moba, general)",
+                "default": "general"
+            },
+            "complexity": {
+                "type": "string",
+                "description": "스크립트 복잡도 (simple, medium, complex)",
+                "default": "medium"
             }
-        ),
-        Tool(
-            name="validate_msl",
-            description="MSL 스크립트의 구문과 논리적 오류를 검증합니다. 성능 문제나 비효율적인 패턴을 진단합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "검증할 MSL 스크립트 코드"
-                    },
-                    "strict": {
-                        "type": "boolean",
-                        "description": "엄격한 검증 모드 활성화",
-                        "default": False
-                    }
-                },
-                "required": ["script"]
+        },
+        "required": ["prompt"]
+    }
+)
+
+VALIDATE_MSL_TOOL = Tool(
+    name="validate_msl",
+    description="MSL 스크립트의 구문과 논리적 오류를 검증합니다. 성능 문제나 비효율적인 패턴을 진단합니다.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "script": {
+                "type": "string",
+                "description": "검증할 MSL 스크립트 코드"
+            },
+            "strict": {
+                "type": "boolean",
+                "description": "엄격한 검증 모드 활성화",
+                "default": False
             }
-        ),
-        Tool(
-            name="optimize_msl",
-            description="MSL 스크립트를 최적화하여 성능을 개선하고 더 효율적인 구조로 변환합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "최적화할 MSL 스크립트 코드"
-                    },
-                    "target": {
-                        "type": "string",
-                        "description": "최적화 목표 (speed, readability, compatibility)",
-                        "default": "speed"
-                    }
-                },
-                "required": ["script"]
+        },
+        "required": ["script"]
+    }
+)
+
+OPTIMIZE_MSL_TOOL = Tool(
+    name="optimize_msl",
+    description="MSL 스크립트를 최적화하여 성능을 개선하고 더 효율적인 구조로 변환합니다.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "script": {
+                "type": "string",
+                "description": "최적화할 MSL 스크립트 코드"
+            },
+            "target": {
+                "type": "string",
+                "description": "최적화 목표 (speed, readability, compatibility)",
+                "default": "speed"
             }
-        ),
-        Tool(
-            name="explain_msl",
-            description="MSL 스크립트나 특정 구문을 상세히 설명합니다. 동작 방식과 매개변수를 분석하여 학습을 도와줍니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input": {
-                        "type": "string",
-                        "description": "설명할 MSL 스크립트 또는 구문"
-                    },
-                    "detail_level": {
-                        "type": "string",
-                        "description": "설명 상세도 (basic, intermediate, advanced)",
-                        "default": "intermediate"
-                    }
-                },
-                "required": ["input"]
+        },
+        "required": ["script"]
+    }
+)
+
+EXPLAIN_MSL_TOOL = Tool(
+    name="explain_msl",
+    description="MSL 스크립트나 특정 구문을 상세히 설명합니다. 동작 방식과 매개변수를 분석하여 학습을 도와줍니다.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "input": {
+                "type": "string",
+                "description": "설명할 MSL 스크립트 또는 구문"
+            },
+            "detail_level": {
+                "type": "string",
+                "description": "설명 상세도 (basic, intermediate, advanced)",
+                "default": "intermediate"
             }
-        ),
-        Tool(
-            name="msl_examples",
-            description="특정 카테고리나 게임 타입에 맞는 MSL 예제를 제공합니다. 학습 목적이나 템플릿으로 활용할 수 있습니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "예제 카테고리 (combat, movement, ui_interaction, combo, timing)",
-                        "default": "all"
-                    },
-                    "game_type": {
-                        "type": "string",
-                        "description": "게임 타입 (fps, mmo, rts, moba, general)",
-                        "default": "general"
-                    },
-                    "count": {
-                        "type": "integer",
-                        "description": "반환할 예제 개수",
-                        "default": 5,
-                        "minimum": 1,
-                        "maximum": 20
-                    }
-                }
+        },
+        "required": ["input"]
+    }
+)
+
+MSL_EXAMPLES_TOOL = Tool(
+    name="msl_examples",
+    description="특정 카테고리나 게임 타입에 맞는 MSL 예제를 제공합니다. 학습 목적이나 템플릿으로 활용할 수 있습니다.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "category": {
+                "type": "string",
+                "description": "예제 카테고리 (combat, movement, ui_interaction, combo, timing)",
+                "default": "all"
+            },
+            "game_type": {
+                "type": "string",
+                "description": "게임 타입 (fps, mmo, rts, moba, general)",
+                "default": "general"
+            },
+            "count": {
+                "type": "integer",
+                "description": "반환할 예제 개수",
+                "default": 5,
+                "minimum": 1,
+                "maximum": 20
             }
-        )
-    ]
+        }
+    }
+)
+
+MSL_TOOLS: list[Tool] = [
+    PARSE_MSL_TOOL,
+    GENERATE_MSL_TOOL,
+    VALIDATE_MSL_TOOL,
+    OPTIMIZE_MSL_TOOL,
+    EXPLAIN_MSL_TOOL,
+    MSL_EXAMPLES_TOOL,
+]
+
+# 도구별 인자 검증 함수 (fastjsonschema가 설치된 경우 스키마를 미리 컴파일해 둡니다)
+ARGUMENT_VALIDATORS: Dict[str, Callable[[dict], dict]] = (
+    {tool.name: fastjsonschema.compile(tool.inputSchema) for tool in MSL_TOOLS}
+    if fastjsonschema is not None else {}
+)
+
 
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """
+    사용 가능한 MSL 도구 목록을 반환합니다.
+    
+    Returns:
+        list[Tool]: 6개 MSL 도구의 정의 목록
+    """
+    return MSL_TOOLS
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+
+async def _run_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
+    """
+    도구를 실행합니다.
+    
+    파싱/검증/최적화/설명 도구는 긴 스크립트(OFFLOAD_SCRIPT_LENGTH 이상)만 스스로
+    스레드로 넘기므로, 짧은 스크립트는 직렬화나 스레드 전환 없이 이벤트 루프에서 바로 처리됩니다.
+    """
+    result = await _get_tool(name).execute(arguments)
+    return result or _EMPTY_RESULT
+
+
+def _make_call_tool(run_tool: Callable[[str, Dict[str, Any]], Awaitable[list[TextContent]]]):
     """
-    요청된 MSL 도구를 실행합니다.
+    도구 실행 함수를 클로저로 고정한 call_tool 핸들러를 생성합니다.
+    
+    도구 이름 집합과 실행 함수를 클로저 변수로 고정하므로 요청 라우팅 경로에서
+    전역 이름 조회가 발생하지 않습니다.
     
     Args:
-        name (str): 실행할 도구 이름
-        arguments (dict): 도구 실행에 필요한 매개변수
+        run_tool (Callable): 도구 이름과 인자를 받아 실행 결과를 반환하는 코루틴 함수
         
     Returns:
-        list[TextContent]: 도구 실행 결과
+        Callable: MCP 서버에 등록할 call_tool 핸들러
     """
-    try:
-        if name == "parse_msl":
-            result = await parse_tool.execute(arguments)
-        elif name == "generate_msl":
-            result = await generate_tool.execute(arguments)
-        elif name == "validate_msl":
-            result = await validate_tool.execute(arguments)
-        elif name == "optimize_msl":
-            result = await optimize_tool.execute(arguments)
-        elif name == "explain_msl":
-            result = await explain_tool.execute(arguments)
-        elif name == "msl_examples":
-            result = await examples_tool.execute(arguments)
-        else:
-            return [TextContent(type="text", text=f"알 수 없는 도구: {name}")]
+    cacheable_tools = CACHEABLE_TOOLS
+    known_tools = frozenset(TOOL_FACTORIES)
+    argument_validators = ARGUMENT_VALIDATORS
+    pending_results = _pending_results
+    
+    async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+        """
+        요청된 MSL 도구를 실행합니다.
         
-        return [TextContent(type="text", text=result)]
+        같은 인자로 동시에 들어온 요청은 하나의 실행 결과를 함께 기다립니다.
         
-    except Exception as e:
-        logger.error(f"도구 실행 중 오류 발생 ({name}): {e}")
-        return [TextContent(type="text", text=f"오류: {str(e)}")]
+        Args:
+            name (str): 실행할 도구 이름
+            arguments (dict): 도구 실행에 필요한 매개변수
+            
+        Returns:
+            list[TextContent]: 도구 실행 결과
+        """
+        try:
+            if name not in known_tools:
+                logger.warning("알 수 없는 도구 요청: %s", name)
+                return [TextContent(type="text", text=f"알 수 없는 도구: {name}")]
+            
+            validate_arguments = argument_validators.get(name)
+            if validate_arguments is not None:
+                try:
+                    # 검증과 함께 스키마의 기본값이 채워집니다
+                    arguments = validate_arguments(arguments or {})
+                except fastjsonschema.JsonSchemaValueException as e:
+                    return [TextContent(type="text", text=f"잘못된 인자 ({name}): {e.message}")]
+            
+            cache_key = _make_cache_key(name, arguments) if name in cacheable_tools else None
+            if cache_key is None:
+                return await run_tool(name, arguments)
+            
+            cached = _get_cached_result(cache_key)
+            if cached is not None:
+                return cached
+            
+            pending = pending_results.get(cache_key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+            
+            task = asyncio.ensure_future(run_tool(name, arguments))
+            pending_results[cache_key] = task
+            try:
+                result = await asyncio.shield(task)
+            finally:
+                pending_results.pop(cache_key, None)
+            
+            _store_cached_result(cache_key, result)
+            return result
+            
+        except Exception as e:
+            logger.error("도구 실행 중 오류 발생 (%s): %s", name, e)
+            return [TextContent(type="text", text=f"오류: {str(e)}")]
+    
+    return call_tool
+
+
+call_tool = server.call_tool()(_make_call_tool(_run_tool))
 
 
-async def main():
+async def serve():
     """
     MSL MCP 서버를 시작합니다.
     """
     logger.info("MSL MCP 서버 시작 중...")
-    logger.info("지원 도구: parse_msl, generate_msl, validate_msl, optimize_msl, explain_msl, msl_examples")
+    logger.info("지원 도구: %s", ", ".join(TOOL_FACTORIES))
     
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
@@ -225,5 +378,31 @@ async def main():
         )
 
 
+def _install_event_loop_policy():
+    """
+    uvloop이 설치되어 있으면 이벤트 루프 정책을 uvloop으로 교체합니다.
+    
+    Windows에서는 uvloop을 사용할 수 없으므로 기본 asyncio 루프를 유지합니다.
+    """
+    if sys.platform == "win32":
+        return
+    
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("uvloop 이벤트 루프 사용")
+
+
+def main():
+    """
+    명령줄 진입점 (python -m mslmcpserver.server 또는 msl-mcp-server 스크립트)
+    """
+    _install_event_loop_policy()
+    asyncio.run(serve())
+
+
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    main() 
\ No newline at end of file
@@ -0,0 +1 @@
+"""MSL MCP 서버 도구 테스트"""
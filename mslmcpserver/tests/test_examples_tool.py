@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from mslmcpserver.tools.examples_tool import (
+    CATEGORY_GROUPS,
+    EXAMPLES,
+    ExamplesMSLTool,
+    _learning_path_cached,
+    _validate_script_cached,
+)
+
+
+async def _get_examples(arguments):
+    result = await ExamplesMSLTool().execute(arguments)
+    return json.loads(result[0].text)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("category", sorted(CATEGORY_GROUPS))
+async def test_schema_category_returns_examples(category):
+    # 스키마의 영어 카테고리는 한국어 예제 그룹으로 연결되어야 합니다
+    response = await _get_examples({"category": category, "count": 20})
+    
+    assert response["success"]
+    assert response["examples"]
+    
+    expected_categories = {EXAMPLES[key]["category"] for key in CATEGORY_GROUPS[category]}
+    assert {example["category"] for example in response["examples"]} <= expected_categories
+
+
+@pytest.mark.asyncio
+async def test_group_key_category():
+    response = await _get_examples({"category": "repeats", "count": 20})
+    
+    assert len(response["examples"]) == len(EXAMPLES["repeats"]["examples"])
+    assert {example["category"] for example in response["examples"]} == {"반복 실행"}
+
+
+@pytest.mark.asyncio
+async def test_unknown_category_is_search_term():
+    # 스키마에 없는 값은 기존처럼 예제 내용에서 검색합니다
+    response = await _get_examples({"category": "반복", "count": 20})
+    assert response["examples"]
+    
+    response = await _get_examples({"category": "없는카테고리"})
+    assert response["examples"] == []
+
+
+@pytest.mark.asyncio
+async def test_game_type_narrows_category():
+    response = await _get_examples({"category": "combat", "game_type": "fps"})
+    
+    assert response["examples"]
+    assert {example["category"] for example in response["examples"]} == {"FPS 게임"}
+
+
+@pytest.mark.asyncio
+async def test_public_methods_return_mutable_copies():
+    # 공개 메서드는 일반 dict/list 복사본을 반환하므로 수정해도 공유 데이터가 바뀌지 않습니다
+    tool = ExamplesMSLTool()
+    
+    examples = await tool.get_examples()
+    group = examples["examples"]["repeats"]
+    assert type(examples["filters_applied"]) is dict
+    assert type(group) is dict
+    assert type(group["examples"]) is list
+    group["examples"].clear()
+    assert EXAMPLES["repeats"]["examples"]
+    
+    name = EXAMPLES["repeats"]["examples"][0]["name"]
+    found = await tool.get_example_by_name(name)
+    assert type(found["example"]) is dict
+    found["example"]["name"] = "changed"
+    assert EXAMPLES["repeats"]["examples"][0]["name"] == name
+    
+    path = await tool.get_learning_path("초급")
+    assert type(path["learning_path"][0]["categories"][0]["recommended_examples"][0]) is dict
+    
+    categories = await tool.get_categories()
+    categories["difficulty_levels"].append("없음")
+    assert "없음" not in (await tool.get_categories())["difficulty_levels"]
+
+
+@pytest.mark.asyncio
+async def test_learning_path_cache_is_shared_between_instances():
+    _learning_path_cached.cache_clear()
+    first = await ExamplesMSLTool().get_learning_path("중급")
+    second = await ExamplesMSLTool().get_learning_path("중급")
+    
+    assert first == second
+    info = _learning_path_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("script, node_count, estimated_time", [
+    ("Q", 1, 50.0),
+    ("Q,W,E", 4, 150.0),
+    ("Q+W", 3, 50.0),
+    ("W(500)", 2, 550.0),
+    ("(Q,W)*3", 5, 300.0),
+])
+def test_validation_metrics_follow_node_types(script, node_count, estimated_time):
+    # 순차 실행은 시간을 더하고, 동시 실행은 가장 긴 시간, 지연과 반복은 값만큼 늘어납니다
+    validation = _validate_script_cached(script)
+    
+    assert validation["is_valid"]
+    assert validation["ast_nodes"] == node_count
+    assert validation["estimated_time"] == estimated_time
@@ -0,0 +1,30 @@
+import pytest
+
+from mslmcpserver.tools.explain_tool import ExplainMSLTool, _explain_cached
+
+
+@pytest.mark.asyncio
+async def test_explain_cache_is_shared_between_instances():
+    _explain_cached.cache_clear()
+    
+    await ExplainMSLTool().explain_script("Q,W", "standard")
+    await ExplainMSLTool().explain_script("Q,W", "standard")
+    
+    info = _explain_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_explain_script_returns_mutable_copy():
+    # 결과를 수정해도 캐시된 설명은 바뀌지 않아야 합니다
+    tool = ExplainMSLTool()
+    
+    result = await tool.explain_script("Q,(100),W", "standard")
+    assert type(result["key_sequence"]) is list
+    assert type(result["explanation"]) is dict
+    result["key_sequence"].append("X")
+    result["explanation"].clear()
+    
+    again = await tool.explain_script("Q,(100),W", "standard")
+    assert "X" not in again["key_sequence"]
+    assert again["explanation"]
@@ -0,0 +1,78 @@
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+from mslmcpserver.tools import generate_tool
+from mslmcpserver.tools.generate_tool import GenerateMSLTool
+
+PROMPT = "컨트롤c 누르고 컨트롤v 누르기"
+OPENAI_SCRIPT = "ctrl+c,(50),ctrl+v"
+
+
+class StubOpenAI:
+    """요청 횟수를 세고, release가 설정될 때까지 응답을 미루는 OpenAI 통합 대역"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+    
+    async def generate_msl_script_streaming(self, prompt, context=None):
+        self.calls += 1
+        await self.release.wait()
+        return {"msl_script": OPENAI_SCRIPT}
+
+
+@pytest.fixture
+def stub_openai(monkeypatch):
+    stub = StubOpenAI()
+    
+    async def get_stub():
+        return stub
+    
+    monkeypatch.setattr(generate_tool, "get_openai_integration", get_stub)
+    # 메모리/디스크 캐시와 실행 중 요청 목록을 테스트마다 비웁니다
+    monkeypatch.setattr(generate_tool, "diskcache", None)
+    monkeypatch.setattr(generate_tool, "_generation_cache", OrderedDict())
+    monkeypatch.setattr(generate_tool, "_pending_generations", {})
+    return stub
+
+
+def _analysis(tool):
+    analysis = tool._analyze_prompt(PROMPT, "", "medium")
+    analysis["original_prompt"] = PROMPT
+    return analysis
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call(stub_openai):
+    tool = GenerateMSLTool()
+    
+    requests = [asyncio.ensure_future(tool._generate_msl_script(_analysis(tool))) for _ in range(3)]
+    await asyncio.sleep(0)
+    stub_openai.release.set()
+    scripts = await asyncio.gather(*requests)
+    
+    assert scripts == [OPENAI_SCRIPT] * 3
+    assert stub_openai.calls == 1
+    assert generate_tool._pending_generations == {}
+
+
+@pytest.mark.asyncio
+async def test_timeout_falls_back_and_caches_late_response(stub_openai, monkeypatch):
+    monkeypatch.setattr(generate_tool, "OPENAI_GENERATION_TIMEOUT", 0.01)
+    tool = GenerateMSLTool()
+    analysis = _analysis(tool)
+    
+    # 시간 안에 응답이 없으면 패턴 매칭 결과를 반환합니다
+    script = await tool._generate_msl_script(analysis)
+    assert script == tool._pattern_generate(analysis)
+    assert script != OPENAI_SCRIPT
+    
+    # 늦게 도착한 응답은 캐시에 저장되어 다음 같은 요청에 쓰입니다
+    (pending,) = generate_tool._pending_generations.values()
+    stub_openai.release.set()
+    await pending
+    
+    assert await tool._generate_msl_script(analysis) == OPENAI_SCRIPT
+    assert stub_openai.calls == 1
@@ -0,0 +1,42 @@
+import pytest
+from mcp.types import TextContent
+
+fastjsonschema = pytest.importorskip("fastjsonschema")
+
+from mslmcpserver import server
+
+
+async def _call_recorded(name, arguments):
+    # 도구 대신 검증을 거친 인자를 기록하는 call_tool 핸들러로 호출합니다
+    received = []
+    
+    async def run_tool(tool_name, tool_arguments):
+        received.append((tool_name, tool_arguments))
+        return [TextContent(type="text", text="ok")]
+    
+    result = await server._make_call_tool(run_tool)(name, arguments)
+    return result, received
+
+
+def test_validators_are_compiled_for_every_tool():
+    assert set(server.ARGUMENT_VALIDATORS) == set(server.TOOL_FACTORIES)
+
+
+@pytest.mark.asyncio
+async def test_invalid_arguments_are_rejected():
+    result, received = await _call_recorded("generate_msl", {"prompt": 123})
+    
+    assert received == []
+    assert result[0].text.startswith("잘못된 인자 (generate_msl): ")
+    
+    result, received = await _call_recorded("generate_msl", {})
+    assert received == []
+    assert "prompt" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_schema_defaults_are_filled():
+    result, received = await _call_recorded("generate_msl", {"prompt": "점프"})
+    
+    assert result[0].text == "ok"
+    assert received == [("generate_msl", {"prompt": "점프", "game_type": "general", "complexity": "medium"})]
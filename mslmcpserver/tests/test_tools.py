@@ -0,0 +1,65 @@
+import pytest
+from mcp.types import TextContent
+
+from mslmcpserver import server
+from mslmcpserver.tools import (
+    ExamplesMSLTool,
+    ExplainMSLTool,
+    GenerateMSLTool,
+    OptimizeMSLTool,
+    ParseMSLTool,
+    ValidateMSLTool,
+)
+from mslmcpserver.tools import generate_tool
+
+# 도구 이름 → (도구 클래스, call_tool 인자)
+TOOL_CASES = {
+    "parse_msl": (ParseMSLTool, {"script": "W(500),A+Shift"}),
+    "generate_msl": (GenerateMSLTool, {"prompt": "컨트롤C 누르고 컨트롤V 누르기"}),
+    "validate_msl": (ValidateMSLTool, {"script": "Q,(500),W"}),
+    "optimize_msl": (OptimizeMSLTool, {"script": "W,W,W,(100),A"}),
+    "explain_msl": (ExplainMSLTool, {"input": "(Q+E)*2,W(500)"}),
+    "msl_examples": (ExamplesMSLTool, {"category": "combat"}),
+}
+
+
+@pytest.fixture(autouse=True)
+def offline_generation(monkeypatch, tmp_path):
+    # OpenAI 키 없이 패턴 매칭으로 생성하고, 생성 캐시는 임시 디렉터리에 둡니다
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(generate_tool, "GENERATION_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(generate_tool, "_generation_disk_cache", None)
+
+
+def test_every_tool_is_registered():
+    assert set(server.TOOL_FACTORIES) == set(TOOL_CASES)
+    for name, (tool_class, _) in TOOL_CASES.items():
+        assert server.TOOL_FACTORIES[name] is tool_class
+
+
+@pytest.mark.parametrize("name", sorted(TOOL_CASES))
+def test_tool_constructs(name):
+    tool_class, _ = TOOL_CASES[name]
+    tool = tool_class()
+    assert callable(tool.execute)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(TOOL_CASES))
+async def test_call_tool_round_trip(name):
+    _, arguments = TOOL_CASES[name]
+    result = await server.call_tool(name, arguments)
+    
+    assert result
+    assert all(isinstance(content, TextContent) for content in result)
+    text = result[0].text
+    assert text
+    # 오류 응답은 "❌"/"오류:"로 시작하거나 JSON의 success가 false입니다
+    assert not text.startswith(("❌", "오류:"))
+    assert '"success": false' not in text
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_names_the_tool():
+    result = await server.call_tool("nope", {})
+    assert result[0].text == "알 수 없는 도구: nope"
@@ -12,18 +12,18 @@ MSL MCP 서버 도구 패키지
 - examples_tool: MSL 예제 제공
 """
 
-from .parse_tool import ParseTool
-from .generate_tool import GenerateTool
-from .validate_tool import ValidateTool
-from .optimize_tool import OptimizeTool
-from .explain_tool import ExplainTool
-from .examples_tool import ExamplesTool
+from .parse_tool import ParseMSLTool
+from .generate_tool import GenerateMSLTool
+from .validate_tool import ValidateMSLTool
+from .optimize_tool import OptimizeMSLTool
+from .explain_tool import ExplainMSLTool
+from .examples_tool import ExamplesMSLTool
 
 __all__ = [
-    'ParseTool',
-    'GenerateTool', 
-    'ValidateTool',
-    'OptimizeTool',
-    'ExplainTool',
-    'ExamplesTool'
+    'ParseMSLTool',
+    'GenerateMSLTool', 
+    'ValidateMSLTool',
+    'OptimizeMSLTool',
+    'ExplainMSLTool',
+    'ExamplesMSLTool'
 ] 
\ No newline at end of file
@@ -4,12 +4,358 @@ MSL 구문을 분석하고 초보자가 이해하기 쉽게 설명해주는 도
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+import functools
+import json
+from collections import Counter, namedtuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, Tuple
+from mcp.types import TextContent
+
 from ..msl.msl_parser import MSLParser
-from ..msl.msl_lexer import MSLLexer
 from ..msl.msl_ast import *
+from .readonly import freeze, thaw
+
+# 이 길이(문자 수) 이상의 스크립트는 이벤트 루프 밖의 스레드에서 분석합니다
+OFFLOAD_SCRIPT_LENGTH = 2000
+
+# 짧은 스크립트 분석용 파서 (모든 인스턴스가 공유).
+# 짧은 스크립트는 이벤트 루프 스레드에서만 파싱하므로 호출이 겹치지 않습니다.
+_PARSER = MSLParser()
+
+# MCP 도구 스키마의 설명 수준 → explain_script 설명 상세도
+DETAIL_LEVEL_ALIASES = {
+    "basic": "basic",
+    "intermediate": "standard",
+    "advanced": "detailed"
+}
+
+# 매개변수가 없는 노드 타입의 고정 설명 (KeyNode/RepeatNode/DelayNode는 값에 따라 달라짐)
+STATIC_NODE_DESCRIPTIONS: Dict[type, str] = {
+    SequentialNode: "순차 실행 (왼쪽 동작 완료 후 오른쪽 동작)",
+    SimultaneousNode: "동시 실행 (여러 동작을 같은 시간에)",
+    HoldChainNode: "홀드 연결 (앞 키를 누른 상태로 다음 동작)",
+    HoldNode: "홀드 실행 (키를 누른 상태로 유지)",
+    ParallelNode: "병렬 실행 (독립적인 동작들을 동시에)",
+    ToggleNode: "토글 실행 (키 상태 반전)",
+    ContinuousNode: "연속 실행 (키를 계속 누른 상태)",
+    GroupNode: "그룹 실행 (묶음 동작)",
+}
+
+# 노드 타입별 상세 설명
+NODE_EXPLANATIONS: Dict[type, str] = {
+    KeyNode: "키보드의 특정 키를 한 번 누르고 떼는 동작입니다.",
+    SequentialNode: "왼쪽 동작이 완전히 끝난 후에 오른쪽 동작을 시작합니다. 순서가 중요한 매크로에 사용됩니다.",
+    SimultaneousNode: "여러 동작을 정확히 같은 시간에 시작합니다. 키 조합(Ctrl+C 등)에 주로 사용됩니다.",
+    HoldChainNode: "키를 누른 상태를 유지하면서 다른 동작을 실행합니다. 이동키를 누른 상태에서 스킬을 사용할 때 유용합니다.",
+    HoldNode: "지정된 시간 동안 키를 누른 상태로 유지한 뒤 뗍니다. 차지 스킬 등에 사용됩니다.",
+    ParallelNode: "두 동작을 독립적으로 동시에 실행합니다. 하나가 끝나도 다른 것은 계속 실행됩니다.",
+    ToggleNode: "키의 현재 상태를 반전시킵니다. 눌려있으면 떼고, 떼져있으면 누릅니다.",
+    RepeatNode: "지정된 횟수만큼 동작을 반복합니다. 연사나 반복 동작에 사용됩니다.",
+    ContinuousNode: "키를 계속 누른 상태로 유지합니다. 이동이나 연속 동작에 사용됩니다.",
+    DelayNode: "지정된 시간만큼 대기합니다. 동작 사이의 타이밍을 조절할 때 사용됩니다.",
+    GroupNode: "여러 동작을 하나의 그룹으로 묶어서 처리합니다."
+}
+
+def _describe_key(tool, node) -> str:
+    key_name = tool.special_keys.get(node.key_name.lower(), f"'{node.key_name}' 키")
+    return f"{key_name} 입력"
+
+
+def _standard_explanation(node) -> str:
+    return NODE_EXPLANATIONS.get(type(node), "특수한 동작을 수행합니다.")
+
+
+def _detailed_explanation(node) -> str:
+    # 추가 세부 정보 제공
+    suffix = DETAILED_EXPLANATION_SUFFIXES.get(type(node))
+    base_explanation = _standard_explanation(node)
+    return base_explanation + suffix(node) if suffix is not None else base_explanation
+
+
+# 딜레이/반복 값별 문구 (스크립트에는 같은 값이 반복되므로 값별로 캐시)
+@functools.lru_cache(maxsize=1024)
+def _repeat_description(count) -> str:
+    return f"반복 실행 ({count}번)"
+
+
+@functools.lru_cache(maxsize=1024)
+def _delay_description(delay) -> str:
+    return f"대기 ({delay}ms)"
+
+
+@functools.lru_cache(maxsize=1024)
+def _delay_detail(delay) -> str:
+    return f" {delay}밀리초는 약 {delay/1000:.2f}초입니다."
+
+
+# 값에 따라 달라지는 노드 설명 (tool, node) -> str
+NODE_DESCRIBERS: Dict[type, Callable[[Any, Any], str]] = {
+    KeyNode: _describe_key,
+    RepeatNode: lambda tool, node: _repeat_description(node.count),
+    DelayNode: lambda tool, node: _delay_description(node.delay_time),
+}
+
+# detailed 수준에서 상세 설명 뒤에 덧붙이는 문장
+DETAILED_EXPLANATION_SUFFIXES: Dict[type, Callable[[Any], str]] = {
+    KeyNode: lambda node: f" 게임에서 '{node.key_name}' 키의 기능을 실행합니다.",
+    DelayNode: lambda node: _delay_detail(node.delay_time),
+    RepeatNode: lambda node: " 총 실행 시간은 반복 내용에 따라 달라집니다.",
+}
+
+# 노드 타입 → MSL 연산자
+_OPS_FOR_TYPE: Dict[type, str] = {
+    SequentialNode: ',',
+    SimultaneousNode: '+',
+    HoldChainNode: '>',
+    ParallelNode: '|',
+    ToggleNode: '~',
+    RepeatNode: '*',
+    ContinuousNode: '&',
+}
+
+
+# 노드 타입 → 실행 시간 계산 (node, child_times) -> 밀리초
+# 표에 없는 타입은 키 입력(50ms)으로 봅니다.
+_TIME_RULE: Dict[type, Callable[..., float]] = {
+    # 키 뒤의 지연(W(500))은 키 입력 후 대기
+    DelayNode: lambda node, child_times: sum(child_times) + node.delay_time,
+    HoldNode: lambda node, child_times: max(sum(child_times), float(node.hold_time)),
+    IntervalNode: lambda node, child_times: float(node.interval_time),
+    # 순차 실행은 시간을 더함
+    SequentialNode: lambda node, child_times: sum(child_times),
+    HoldChainNode: lambda node, child_times: sum(child_times),
+    GroupNode: lambda node, child_times: sum(child_times),
+    # 동시 실행은 가장 긴 시간을 선택
+    SimultaneousNode: lambda node, child_times: max(child_times),
+    ParallelNode: lambda node, child_times: max(child_times),
+    # 반복은 내용 시간 × 반복 횟수
+    RepeatNode: lambda node, child_times: sum(child_times) * node.count,
+}
+
+DEFAULT_ACTION_TIME = 50.0
+
+
+# 실행 흐름 단계 처리기 (tool, node, step, timing, tasks, flow) -> 다음 단계
+def _flow_sequence(tool, node, step, timing, tasks, flow) -> int:
+    # 순차 실행: 첫 번째 자식부터 차례로
+    for child in reversed(node.children):
+        tasks.append(("visit", child))
+    return step
+
+
+def _flow_concurrent(tool, node, step, timing, tasks, flow) -> int:
+    # 동시 실행: 모든 자식이 같은 단계에서 시작한 뒤 한 단계만 진행
+    tasks.append(("set", step + 1))
+    for child in reversed(node.children):
+        tasks.append(("visit", child))
+        tasks.append(("set", step))
+    return step
+
+
+def _flow_delay(tool, node, step, timing, tasks, flow) -> int:
+    # 키 뒤의 지연(W(500))은 키를 먼저 누른 뒤 대기합니다
+    tasks.append(("wait", node))
+    for child in reversed(node.children):
+        tasks.append(("visit", child))
+    return step
+
+
+def _flow_wait(node, step, timing, flow) -> int:
+    # 대기 시간 추가
+    flow.append({
+        "step": step,
+        "timing": timing,
+        "action": "대기",
+        "description": f"{node.delay_time}ms 대기",
+        "type": "delay"
+    })
+    return step + 1
 
-class ExplainTool:
+
+def _flow_action(tool, node, step, timing, tasks, flow) -> int:
+    # 기본 동작
+    flow.append({
+        "step": step,
+        "timing": timing,
+        "action": tool._get_node_description(node),
+        "description": _standard_explanation(node),
+        "type": "action"
+    })
+    return step + 1
+
+
+# 표에 없는 타입은 _flow_action으로 처리합니다
+_STEP_HANDLER: Dict[type, Callable[..., int]] = {
+    SequentialNode: _flow_sequence,
+    HoldChainNode: _flow_sequence,
+    GroupNode: _flow_sequence,
+    SimultaneousNode: _flow_concurrent,
+    ParallelNode: _flow_concurrent,
+    DelayNode: _flow_delay,
+}
+
+
+# 평탄화된 AST 명령 하나 (전위 순서)
+# code: 노드 타입, level: 깊이, n_children: 후위 계산 시 값 스택에서 꺼낼 자식 수
+Op = namedtuple("Op", "code node level n_children")
+
+
+def _lower(ast) -> List[Op]:
+    """
+    AST를 전위 순서의 명령 목록으로 한 번 평탄화합니다
+    
+    설명 헬퍼들은 트리를 다시 순회하지 않고 이 목록을 선형으로 훑습니다.
+    """
+    ops: List[Op] = []
+    append = ops.append
+    
+    # (노드, 깊이)
+    stack = [(ast, 0)]
+    while stack:
+        node, level = stack.pop()
+        children = node.children
+        append(Op(type(node), node, level, len(children)))
+        
+        # 자식은 전위 순서가 유지되도록 역순으로 넣습니다
+        level += 1
+        for child in reversed(children):
+            stack.append((child, level))
+    
+    return ops
+
+
+# 자식이 없는 노드가 함께 쓰는 빈 자식 시간 (읽기 전용)
+_NO_CHILD_TIMES: Tuple[float, ...] = ()
+
+
+def _total_time(ops: List[Op]) -> float:
+    """명령 목록을 역순으로 훑는 값 스택으로 루트의 예상 실행 시간을 구합니다"""
+    values: List[float] = []
+    push = values.append
+    get_rule = _TIME_RULE.get
+    for code, node, _level, n_children in reversed(ops):
+        time_rule = get_rule(code)
+        if time_rule is None:
+            # 키 입력 등은 자식 값과 상관없이 기본 시간이므로 꺼내기만 합니다
+            if n_children:
+                del values[-n_children:]
+            push(DEFAULT_ACTION_TIME)
+            continue
+        
+        # 역순으로 처리하므로 첫 번째 자식의 값이 스택 맨 위에 있습니다
+        if n_children:
+            child_times = values[-n_children:]
+            child_times.reverse()
+            del values[-n_children:]
+        else:
+            child_times = _NO_CHILD_TIMES
+        push(time_rule(node, child_times))
+    return values[-1]
+
+
+# MSL 연산자별 설명 사전
+OPERATOR_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    ',': "순차 실행: 왼쪽 동작 완료 후 오른쪽 동작 실행",
+    '+': "동시 실행: 여러 동작을 같은 시간에 실행",
+    '>': "홀드: 키를 누른 상태로 유지하면서 다음 동작 실행",
+    '|': "병렬 실행: 독립적인 두 동작을 동시에 실행",
+    '~': "토글: 키 상태를 반전 (눌려있으면 떼고, 떼져있으면 누름)",
+    '*': "반복: 지정된 횟수만큼 동작 반복",
+    '&': "연속: 키를 계속 누른 상태로 유지"
+})
+
+# 특수 키 설명 사전
+SPECIAL_KEYS: Mapping[str, str] = MappingProxyType({
+    'space': '스페이스바',
+    'enter': '엔터키',
+    'escape': 'ESC키',
+    'tab': '탭키',
+    'shift': '시프트키',
+    'ctrl': '컨트롤키',
+    'alt': '알트키',
+    'win': '윈도우키',
+    'f1': 'F1 기능키',
+    'f2': 'F2 기능키',
+    'f3': 'F3 기능키',
+    'f4': 'F4 기능키',
+    'f5': 'F5 기능키',
+    'f6': 'F6 기능키',
+    'f7': 'F7 기능키',
+    'f8': 'F8 기능키',
+    'f9': 'F9 기능키',
+    'f10': 'F10 기능키',
+    'f11': 'F11 기능키',
+    'f12': 'F12 기능키',
+    'up': '위쪽 화살표키',
+    'down': '아래쪽 화살표키',
+    'left': '왼쪽 화살표키',
+    'right': '오른쪽 화살표키',
+    'home': 'Home키',
+    'end': 'End키',
+    'pageup': 'Page Up키',
+    'pagedown': 'Page Down키',
+    'insert': 'Insert키',
+    'delete': 'Delete키',
+    'backspace': 'Backspace키'
+})
+
+
+# 키 분류용 이름 집합 (소문자)
+MODIFIER_KEYS = frozenset(('ctrl', 'shift', 'alt', 'win'))
+FUNCTION_KEYS = frozenset(f'f{i}' for i in range(1, 13))
+ARROW_KEYS = frozenset(('up', 'down', 'left', 'right'))
+SPECIAL_KEY_NAMES = frozenset(('space', 'enter', 'escape', 'tab', 'backspace', 'delete'))
+
+
+@functools.lru_cache(maxsize=128)
+def _categorize_key(key: str) -> str:
+    """키를 카테고리별로 분류합니다 (스크립트마다 같은 키가 반복되므로 키별로 캐시)"""
+    key_lower = key.lower()
+    if key_lower in MODIFIER_KEYS:
+        return "수식키"
+    elif key_lower in FUNCTION_KEYS:
+        return "기능키"
+    elif key_lower in ARROW_KEYS:
+        return "화살표키"
+    elif key_lower in SPECIAL_KEY_NAMES:
+        return "특수키"
+    elif key.isalpha():
+        return "문자키"
+    elif key.isdigit():
+        return "숫자키"
+    else:
+        return "기타키"
+
+
+@dataclass
+class AstStats:
+    """
+    AST 한 번 순회로 모은 설명용 통계
+    
+    개요, 복잡도, 타이밍, 팁 생성에 필요한 값을 모두 담아 헬퍼마다 트리를
+    다시 순회하지 않도록 합니다.
+    """
+    node_count: int = 0
+    operators: Counter = field(default_factory=Counter)        # 연산자별 사용 횟수 (처음 나온 순서 유지)
+    delays: List[Dict[str, Any]] = field(default_factory=list)  # 딜레이 지점 (전위 순서)
+    keys: List[str] = field(default_factory=list)               # 키 입력 시퀀스
+    concurrent_count: int = 0
+    has_holds: bool = False
+    has_repeats: bool = False
+    has_excessive_delays: bool = False
+    has_repeated_keys: bool = False                             # 키 시퀀스에 같은 키가 연속으로 나오는지
+    total_time: float = 0.0
+    
+    @property
+    def has_delays(self) -> bool:
+        return bool(self.delays)
+    
+    @property
+    def has_concurrent(self) -> bool:
+        return self.concurrent_count > 0
+
+class ExplainMSLTool:
     """
     MSL 스크립트 설명 도구
     
@@ -20,56 +366,29 @@ class ExplainTool:
     - 키 입력 시퀀스 시각화
     """
     
+    __slots__ = ("operator_descriptions", "special_keys")
+    
     def __init__(self):
-        """도구 초기화 - 파서와 어휘분석기 준비"""
-        self.parser = MSLParser()
-        self.lexer = MSLLexer()
-        
-        # MSL 연산자별 설명 사전
-        self.operator_descriptions = {
-            ',': "순차 실행: 왼쪽 동작 완료 후 오른쪽 동작 실행",
-            '+': "동시 실행: 여러 동작을 같은 시간에 실행",
-            '>': "홀드: 키를 누른 상태로 유지하면서 다음 동작 실행",
-            '|': "병렬 실행: 독립적인 두 동작을 동시에 실행",
-            '~': "토글: 키 상태를 반전 (눌려있으면 떼고, 떼져있으면 누름)",
-            '*': "반복: 지정된 횟수만큼 동작 반복",
-            '&': "연속: 키를 계속 누른 상태로 유지"
-        }
-        
-        # 특수 키 설명 사전
-        self.special_keys = {
-            'space': '스페이스바',
-            'enter': '엔터키',
-            'escape': 'ESC키',
-            'tab': '탭키',
-            'shift': '시프트키',
-            'ctrl': '컨트롤키',
-            'alt': '알트키',
-            'win': '윈도우키',
-            'f1': 'F1 기능키',
-            'f2': 'F2 기능키',
-            'f3': 'F3 기능키',
-            'f4': 'F4 기능키',
-            'f5': 'F5 기능키',
-            'f6': 'F6 기능키',
-            'f7': 'F7 기능키',
-            'f8': 'F8 기능키',
-            'f9': 'F9 기능키',
-            'f10': 'F10 기능키',
-            'f11': 'F11 기능키',
-            'f12': 'F12 기능키',
-            'up': '위쪽 화살표키',
-            'down': '아래쪽 화살표키',
-            'left': '왼쪽 화살표키',
-            'right': '오른쪽 화살표키',
-            'home': 'Home키',
-            'end': 'End키',
-            'pageup': 'Page Up키',
-            'pagedown': 'Page Down키',
-            'insert': 'Insert키',
-            'delete': 'Delete키',
-            'backspace': 'Backspace키'
-        }
+        """도구 초기화"""
+        # 연산자/특수 키 설명은 모든 인스턴스가 같은 읽기 전용 사전을 공유합니다
+        self.operator_descriptions = OPERATOR_DESCRIPTIONS
+        self.special_keys = SPECIAL_KEYS
+    
+    async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """설명 도구를 실행합니다."""
+        script = arguments.get("input", "").strip()
+        detail_level = arguments.get("detail_level", "intermediate")
+        
+        if not script:
+            return [TextContent(
+                type="text",
+                text="❌ 오류: 설명할 스크립트가 제공되지 않았습니다.\n\n"
+                     "사용법: explain_msl(input='your_msl_script')"
+            )]
+        
+        detail_level = DETAIL_LEVEL_ALIASES.get(detail_level, detail_level)
+        result = await self.explain_script(script, detail_level)
+        return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
     
     async def explain_script(self, script: str, detail_level: str = "standard") -> Dict[str, Any]:
         """
@@ -82,15 +401,29 @@ class ExplainTool:
         Returns:
             분석 결과와 설명이 담긴 딕셔너리
         """
+        if len(script) < OFFLOAD_SCRIPT_LENGTH:
+            result = _explain_cached(script, detail_level)
+        else:
+            # 긴 스크립트는 분석이 이벤트 루프를 막지 않도록 스레드에서 수행
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, _explain_cached, script, detail_level)
+        # 캐시된 결과는 읽기 전용이므로 호출 측이 수정할 수 있는 복사본을 반환합니다
+        return thaw(result)
+    
+    def _explain(self, script: str, detail_level: str) -> Dict[str, Any]:
+        """explain_script의 동기 구현 (_explain_cached를 통해 호출됩니다)"""
+        # 긴 스크립트는 스레드에서 분석되며, 공유 파서는 파싱 중에 상태를 바꾸므로 새 파서를 사용합니다
+        parser = _PARSER if len(script) < OFFLOAD_SCRIPT_LENGTH else MSLParser()
         try:
-            # 1단계: 토큰 분석
-            tokens = self.lexer.tokenize(script)
+            # 1단계: 토큰 분석 및 구문 분석으로 AST 생성
+            ast = parser.parse(script)
             
-            # 2단계: 구문 분석 및 AST 생성
-            ast = self.parser.parse(tokens)
+            # 2단계: AST 평탄화 및 통계 수집
+            ops = _lower(ast)
+            stats = self._collect_stats(ops)
             
             # 3단계: 설명 생성
-            explanation = self._generate_explanation(ast, script, detail_level)
+            explanation = self._generate_explanation(ops, stats, script, detail_level)
             
             return {
                 "success": True,
@@ -98,9 +431,9 @@ class ExplainTool:
                 "detail_level": detail_level,
                 "explanation": explanation,
                 "execution_flow": self._generate_execution_flow(ast),
-                "key_sequence": self._generate_key_sequence(ast),
-                "timing_info": self._analyze_timing(ast),
-                "educational_tips": self._generate_tips(ast)
+                "key_sequence": list(stats.keys),
+                "timing_info": self._analyze_timing(stats),
+                "educational_tips": self._generate_tips(stats)
             }
             
         except Exception as e:
@@ -111,244 +444,176 @@ class ExplainTool:
                 "suggestion": "스크립트 구문을 확인해주세요. MSL 문법에 맞지 않는 부분이 있을 수 있습니다."
             }
     
-    def _generate_explanation(self, ast: ASTNode, script: str, detail_level: str) -> Dict[str, Any]:
+    def _generate_explanation(self, ops: List[Op], stats: AstStats, script: str, detail_level: str) -> Dict[str, Any]:
         """
         AST를 기반으로 상세한 설명을 생성합니다
         
         Args:
-            ast: 파싱된 AST
+            ops: _lower로 평탄화한 AST
+            stats: _collect_stats로 수집한 AST 통계
             script: 원본 스크립트
             detail_level: 설명 상세도
         
         Returns:
             설명 딕셔너리
         """
+        # 구조 분석과 구성요소 분해가 같은 노드 설명을 쓰므로 한 번만 만듭니다
+        descriptions = [self._get_node_description(op.node) for op in ops]
+        
         explanation = {
-            "overview": self._get_script_overview(ast),
-            "structure_analysis": self._analyze_structure(ast),
-            "component_breakdown": self._break_down_components(ast, detail_level),
-            "complexity_level": self._assess_complexity(ast)
+            "overview": self._get_script_overview(stats),
+            "structure_analysis": self._analyze_structure(ops, descriptions),
+            "component_breakdown": self._break_down_components(ops, descriptions, detail_level),
+            "complexity_level": self._assess_complexity(stats)
         }
         
         if detail_level in ["standard", "detailed"]:
-            explanation["operator_usage"] = self._analyze_operators(ast)
-            explanation["timing_analysis"] = self._analyze_timing_detailed(ast)
+            explanation["operator_usage"] = self._analyze_operators(stats)
+            explanation["timing_analysis"] = self._analyze_timing_detailed(stats)
         
         if detail_level == "detailed":
-            explanation["optimization_suggestions"] = self._suggest_optimizations(ast)
-            explanation["alternative_approaches"] = self._suggest_alternatives(ast)
+            explanation["optimization_suggestions"] = self._suggest_optimizations(stats)
+            explanation["alternative_approaches"] = self._suggest_alternatives(stats)
         
         return explanation
     
-    def _get_script_overview(self, ast: ASTNode) -> str:
+    def _get_script_overview(self, stats: AstStats) -> str:
         """스크립트의 전반적인 개요를 생성합니다"""
-        node_count = self._count_nodes(ast)
-        operators = self._find_operators(ast)
+        operators = stats.operators
         
-        overview = f"이 MSL 스크립트는 총 {node_count}개의 동작으로 구성되어 있습니다."
+        overview = f"이 MSL 스크립트는 총 {stats.node_count}개의 동작으로 구성되어 있습니다."
         
         if operators:
-            operator_names = [self.operator_descriptions.get(op, op) for op in operators]
-            overview += f" 사용된 연산자: {', '.join(set(operator_names))}"
+            # Counter 키는 이미 중복 없이 처음 나온 순서를 유지합니다
+            operator_names = (self.operator_descriptions.get(op, op) for op in operators)
+            overview += " 사용된 연산자: " + ", ".join(operator_names)
         
         return overview
     
-    def _analyze_structure(self, ast: ASTNode) -> Dict[str, Any]:
-        """스크립트의 구조를 분석합니다"""
-        structure = {
-            "type": type(ast).__name__,
-            "description": self._get_node_description(ast),
-            "children": []
-        }
-        
-        # 자식 노드들 재귀적으로 분석
-        if hasattr(ast, 'left') and ast.left:
-            structure["children"].append(self._analyze_structure(ast.left))
-        if hasattr(ast, 'right') and ast.right:
-            structure["children"].append(self._analyze_structure(ast.right))
-        if hasattr(ast, 'children') and ast.children:
-            for child in ast.children:
-                structure["children"].append(self._analyze_structure(child))
-        
-        return structure
-    
-    def _break_down_components(self, ast: ASTNode, detail_level: str) -> List[Dict[str, Any]]:
-        """스크립트의 각 구성요소를 분해하여 설명합니다"""
-        components = []
-        self._collect_components(ast, components, detail_level)
-        return components
-    
-    def _collect_components(self, node: ASTNode, components: List[Dict[str, Any]], detail_level: str, level: int = 0):
-        """재귀적으로 컴포넌트를 수집합니다"""
-        component = {
-            "level": level,
-            "type": type(node).__name__,
-            "description": self._get_node_description(node),
-            "explanation": self._get_detailed_explanation(node, detail_level)
-        }
-        
-        # 특수 속성들 추가
-        if isinstance(node, KeyNode):
-            component["key_info"] = {
-                "key": node.key,
-                "korean_name": self.special_keys.get(node.key.lower(), f"'{node.key}' 키"),
-                "category": self._categorize_key(node.key)
-            }
-        elif isinstance(node, DelayNode):
-            component["timing_info"] = {
-                "delay_ms": node.delay,
-                "description": f"{node.delay}밀리초 대기"
+    def _analyze_structure(self, ops: List[Op], descriptions: List[str]) -> Dict[str, Any]:
+        """스크립트의 구조를 분석합니다 (descriptions는 ops와 같은 순서의 노드 설명)"""
+        # parents[level]: 해당 깊이에서 가장 최근에 만든 구조 (전위 순서이므로 다음 깊이의 부모)
+        parents: List[Dict[str, Any]] = []
+        for op, description in zip(ops, descriptions):
+            structure = {
+                "type": op.code.__name__,
+                "description": description,
+                "children": []
             }
-        elif isinstance(node, RepeatNode):
-            component["repeat_info"] = {
-                "count": node.count,
-                "description": f"{node.count}번 반복 실행"
+            del parents[op.level:]
+            if parents:
+                parents[-1]["children"].append(structure)
+            parents.append(structure)
+        
+        return parents[0]
+    
+    def _break_down_components(self, ops: List[Op], descriptions: List[str], detail_level: str) -> List[Dict[str, Any]]:
+        """스크립트의 각 구성요소를 분해하여 설명합니다 (전위 순서, descriptions는 ops와 같은 순서의 노드 설명)"""
+        # 결과 크기를 미리 알고 있으므로 append 대신 자리를 채웁니다
+        components: List[Dict[str, Any]] = [None] * len(ops)
+        
+        # basic 수준의 설명은 노드 설명과 같습니다
+        reuse_description = detail_level == "basic"
+        explain = self._explanation_renderer(detail_level)
+        
+        for index, op in enumerate(ops):
+            node = op.node
+            description = descriptions[index]
+            component = {
+                "level": op.level,
+                "type": op.code.__name__,
+                "description": description,
+                "explanation": description if reuse_description else explain(node)
             }
+            
+            # 특수 속성들 추가
+            if op.code is KeyNode:
+                component["key_info"] = {
+                    "key": node.key_name,
+                    "korean_name": self.special_keys.get(node.key_name.lower(), f"'{node.key_name}' 키"),
+                    "category": self._categorize_key(node.key_name)
+                }
+            elif op.code is DelayNode:
+                component["timing_info"] = {
+                    "delay_ms": node.delay_time,
+                    "description": f"{node.delay_time}밀리초 대기"
+                }
+            elif op.code is RepeatNode:
+                component["repeat_info"] = {
+                    "count": node.count,
+                    "description": f"{node.count}번 반복 실행"
+                }
+            
+            components[index] = component
         
-        components.append(component)
-        
-        # 자식 노드들 처리
-        if hasattr(node, 'left') and node.left:
-            self._collect_components(node.left, components, detail_level, level + 1)
-        if hasattr(node, 'right') and node.right:
-            self._collect_components(node.right, components, detail_level, level + 1)
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                self._collect_components(child, components, detail_level, level + 1)
+        return components
     
-    def _get_node_description(self, node: ASTNode) -> str:
+    def _get_node_description(self, node: MSLNode) -> str:
         """노드 타입별 설명을 생성합니다"""
-        if isinstance(node, KeyNode):
-            key_name = self.special_keys.get(node.key.lower(), f"'{node.key}' 키")
-            return f"{key_name} 입력"
-        elif isinstance(node, SequenceNode):
-            return "순차 실행 (왼쪽 동작 완료 후 오른쪽 동작)"
-        elif isinstance(node, ConcurrentNode):
-            return "동시 실행 (여러 동작을 같은 시간에)"
-        elif isinstance(node, HoldNode):
-            return "홀드 실행 (키를 누른 상태로 유지)"
-        elif isinstance(node, ParallelNode):
-            return "병렬 실행 (독립적인 동작들을 동시에)"
-        elif isinstance(node, ToggleNode):
-            return "토글 실행 (키 상태 반전)"
-        elif isinstance(node, RepeatNode):
-            return f"반복 실행 ({node.count}번)"
-        elif isinstance(node, ContinuousNode):
-            return "연속 실행 (키를 계속 누른 상태)"
-        elif isinstance(node, DelayNode):
-            return f"대기 ({node.delay}ms)"
-        elif isinstance(node, GroupNode):
-            return "그룹 실행 (묶음 동작)"
-        else:
-            return f"{type(node).__name__} 동작"
+        node_type = type(node)
+        description = STATIC_NODE_DESCRIPTIONS.get(node_type)
+        if description is not None:
+            return description
+        
+        describer = NODE_DESCRIBERS.get(node_type)
+        if describer is not None:
+            return describer(self, node)
+        return f"{node_type.__name__} 동작"
     
-    def _get_detailed_explanation(self, node: ASTNode, detail_level: str) -> str:
+    def _get_detailed_explanation(self, node: MSLNode, detail_level: str) -> str:
         """노드의 상세한 설명을 생성합니다"""
+        return self._explanation_renderer(detail_level)(node)
+    
+    def _explanation_renderer(self, detail_level: str) -> Callable[[MSLNode], str]:
+        """설명 상세도에 맞는 노드 설명 함수를 고릅니다 (노드마다 상세도를 비교하지 않도록 한 번만 선택)"""
         if detail_level == "basic":
-            return self._get_node_description(node)
-        
-        explanations = {
-            KeyNode: "키보드의 특정 키를 한 번 누르고 떼는 동작입니다.",
-            SequenceNode: "왼쪽 동작이 완전히 끝난 후에 오른쪽 동작을 시작합니다. 순서가 중요한 매크로에 사용됩니다.",
-            ConcurrentNode: "여러 동작을 정확히 같은 시간에 시작합니다. 키 조합(Ctrl+C 등)에 주로 사용됩니다.",
-            HoldNode: "키를 누른 상태를 유지하면서 다른 동작을 실행합니다. 이동키를 누른 상태에서 스킬을 사용할 때 유용합니다.",
-            ParallelNode: "두 동작을 독립적으로 동시에 실행합니다. 하나가 끝나도 다른 것은 계속 실행됩니다.",
-            ToggleNode: "키의 현재 상태를 반전시킵니다. 눌려있으면 떼고, 떼져있으면 누릅니다.",
-            RepeatNode: "지정된 횟수만큼 동작을 반복합니다. 연사나 반복 동작에 사용됩니다.",
-            ContinuousNode: "키를 계속 누른 상태로 유지합니다. 이동이나 연속 동작에 사용됩니다.",
-            DelayNode: "지정된 시간만큼 대기합니다. 동작 사이의 타이밍을 조절할 때 사용됩니다.",
-            GroupNode: "여러 동작을 하나의 그룹으로 묶어서 처리합니다."
-        }
-        
-        base_explanation = explanations.get(type(node), "특수한 동작을 수행합니다.")
-        
+            return self._get_node_description
         if detail_level == "detailed":
-            # 추가 세부 정보 제공
-            if isinstance(node, KeyNode):
-                base_explanation += f" 게임에서 '{node.key}' 키의 기능을 실행합니다."
-            elif isinstance(node, DelayNode):
-                base_explanation += f" {node.delay}밀리초는 약 {node.delay/1000:.2f}초입니다."
-            elif isinstance(node, RepeatNode):
-                base_explanation += f" 총 실행 시간은 반복 내용에 따라 달라집니다."
-        
-        return base_explanation
-    
-    def _generate_execution_flow(self, ast: ASTNode) -> List[Dict[str, Any]]:
-        """실행 흐름을 단계별로 생성합니다"""
+            return _detailed_explanation
+        return _standard_explanation
+    
+    def _generate_execution_flow(self, ast: MSLNode, timing: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        실행 흐름을 단계별로 생성합니다
+        
+        작업 스택과 단계 레지스터로 순회합니다. 순차 실행은 앞 자식에서 끝난 단계를
+        다음 자식이 이어받고, 동시 실행은 모든 자식이 같은 단계에서 시작한 뒤 한 단계만 진행합니다.
+        """
         flow = []
-        self._collect_execution_steps(ast, flow, 0)
+        step = 0
+        
+        # ("visit", 노드), ("wait", 지연 노드) 또는 ("set", 단계 값)
+        tasks: List[tuple] = [("visit", ast)]
+        while tasks:
+            action, value = tasks.pop()
+            if action == "set":
+                step = value
+                continue
+            if action == "wait":
+                step = _flow_wait(value, step, timing, flow)
+                continue
+            
+            handler = _STEP_HANDLER.get(type(value), _flow_action)
+            step = handler(self, value, step, timing, tasks, flow)
+        
         return flow
     
-    def _collect_execution_steps(self, node: ASTNode, flow: List[Dict[str, Any]], step: int, timing: float = 0.0):
-        """실행 단계를 재귀적으로 수집합니다"""
-        if isinstance(node, SequenceNode):
-            # 순차 실행: 왼쪽 먼저, 그 다음 오른쪽
-            step = self._collect_execution_steps(node.left, flow, step, timing)
-            step = self._collect_execution_steps(node.right, flow, step, timing)
-        elif isinstance(node, ConcurrentNode):
-            # 동시 실행: 같은 타이밍에 모든 동작
-            self._collect_execution_steps(node.left, flow, step, timing)
-            self._collect_execution_steps(node.right, flow, step, timing)
-            step += 1
-        elif isinstance(node, DelayNode):
-            # 대기 시간 추가
-            flow.append({
-                "step": step,
-                "timing": timing,
-                "action": "대기",
-                "description": f"{node.delay}ms 대기",
-                "type": "delay"
-            })
-            timing += node.delay
-            step += 1
-        else:
-            # 기본 동작
-            flow.append({
-                "step": step,
-                "timing": timing,
-                "action": self._get_node_description(node),
-                "description": self._get_detailed_explanation(node, "standard"),
-                "type": "action"
-            })
-            step += 1
-        
-        return step
-    
-    def _generate_key_sequence(self, ast: ASTNode) -> List[str]:
-        """키 입력 시퀀스를 생성합니다"""
-        sequence = []
-        self._collect_key_sequence(ast, sequence)
-        return sequence
-    
-    def _collect_key_sequence(self, node: ASTNode, sequence: List[str]):
-        """키 시퀀스를 재귀적으로 수집합니다"""
-        if isinstance(node, KeyNode):
-            key_name = self.special_keys.get(node.key.lower(), node.key)
-            sequence.append(key_name)
-        elif hasattr(node, 'left') and node.left:
-            self._collect_key_sequence(node.left, sequence)
-        elif hasattr(node, 'right') and node.right:
-            self._collect_key_sequence(node.right, sequence)
-        elif hasattr(node, 'children') and node.children:
-            for child in node.children:
-                self._collect_key_sequence(child, sequence)
-    
-    def _analyze_timing(self, ast: ASTNode) -> Dict[str, Any]:
+    def _analyze_timing(self, stats: AstStats) -> Dict[str, Any]:
         """타이밍 정보를 분석합니다"""
         timing_info = {
-            "total_estimated_time": self._calculate_total_time(ast),
-            "delay_points": self._find_delays(ast),
-            "concurrent_actions": self._find_concurrent_actions(ast),
-            "timing_critical": self._assess_timing_criticality(ast)
+            "total_estimated_time": stats.total_time,
+            "delay_points": list(stats.delays),
+            "concurrent_actions": ["동시 실행 발견"] * stats.concurrent_count,
+            "timing_critical": self._assess_timing_criticality(stats)
         }
         return timing_info
     
-    def _generate_tips(self, ast: ASTNode) -> List[str]:
+    def _generate_tips(self, stats: AstStats) -> List[str]:
         """교육적 팁을 생성합니다"""
         tips = []
         
         # 복잡도에 따른 팁
-        complexity = self._assess_complexity(ast)
+        complexity = self._assess_complexity(stats)
         if complexity == "초급":
             tips.append("💡 기본적인 키 입력 매크로입니다. 게임에서 간단한 동작 자동화에 적합합니다.")
         elif complexity == "중급":
@@ -357,86 +622,81 @@ class ExplainTool:
             tips.append("💡 복잡한 매크로입니다. 게임의 복잡한 전략이나 연속 동작에 활용됩니다.")
         
         # 구조별 팁
-        if self._has_delays(ast):
+        if stats.has_delays:
             tips.append("⏱️ 대기 시간이 포함되어 있어 정확한 타이밍 제어가 가능합니다.")
         
-        if self._has_concurrent_actions(ast):
+        if stats.has_concurrent:
             tips.append("🔄 동시 실행 동작이 있어 여러 키를 함께 누르는 조합이 가능합니다.")
         
-        if self._has_repeats(ast):
+        if stats.has_repeats:
             tips.append("🔁 반복 동작이 있어 연사나 지속적인 동작이 가능합니다.")
         
         # 최적화 팁
-        optimization_suggestions = self._suggest_optimizations(ast)
+        optimization_suggestions = self._suggest_optimizations(stats)
         if optimization_suggestions:
             tips.append("⚡ 성능 최적화 여지가 있습니다. optimize_msl 도구를 사용해보세요.")
         
         return tips
     
     # 헬퍼 메서드들
-    def _count_nodes(self, node: ASTNode) -> int:
-        """AST 노드 개수를 계산합니다"""
-        count = 1
-        if hasattr(node, 'left') and node.left:
-            count += self._count_nodes(node.left)
-        if hasattr(node, 'right') and node.right:
-            count += self._count_nodes(node.right)
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                count += self._count_nodes(child)
-        return count
-    
-    def _find_operators(self, node: ASTNode) -> List[str]:
-        """사용된 연산자들을 찾습니다"""
-        operators = []
-        
-        if isinstance(node, SequenceNode):
-            operators.append(',')
-        elif isinstance(node, ConcurrentNode):
-            operators.append('+')
-        elif isinstance(node, HoldNode):
-            operators.append('>')
-        elif isinstance(node, ParallelNode):
-            operators.append('|')
-        elif isinstance(node, ToggleNode):
-            operators.append('~')
-        elif isinstance(node, RepeatNode):
-            operators.append('*')
-        elif isinstance(node, ContinuousNode):
-            operators.append('&')
-        
-        # 자식 노드들에서 재귀적으로 찾기
-        if hasattr(node, 'left') and node.left:
-            operators.extend(self._find_operators(node.left))
-        if hasattr(node, 'right') and node.right:
-            operators.extend(self._find_operators(node.right))
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                operators.extend(self._find_operators(child))
-        
-        return operators
+    def _collect_stats(self, ops: List[Op]) -> AstStats:
+        """
+        평탄화된 AST를 한 번 훑어 설명에 필요한 통계를 모두 수집합니다
+        
+        노드 수, 연산자, 딜레이, 키 시퀀스 모두 전위 순서로 전체 노드를 훑습니다.
+        
+        Args:
+            ops: _lower로 평탄화한 AST
+        
+        Returns:
+            수집된 AST 통계
+        """
+        stats = AstStats(node_count=len(ops))
+        operators = stats.operators
+        delays = stats.delays
+        keys = stats.keys
+        operator_for = _OPS_FOR_TYPE.get
+        
+        for op in ops:
+            node_type = op.code
+            
+            symbol = operator_for(node_type)
+            if symbol:
+                operators[symbol] += 1
+                if symbol == '+':
+                    stats.concurrent_count += 1
+                elif symbol == '>':
+                    stats.has_holds = True
+                elif symbol == '*':
+                    stats.has_repeats = True
+            elif node_type is DelayNode:
+                delay = op.node.delay_time
+                delays.append({
+                    "delay": delay,
+                    "description": f"{delay}ms 대기"
+                })
+                if delay > 1000:
+                    stats.has_excessive_delays = True
+            elif node_type is HoldNode:
+                stats.has_holds = True
+            elif node_type is KeyNode:
+                key = op.node.key_name
+                key = self.special_keys.get(key.lower(), key)
+                if keys and keys[-1] == key:
+                    stats.has_repeated_keys = True
+                keys.append(key)
+        
+        stats.total_time = _total_time(ops)
+        return stats
     
     def _categorize_key(self, key: str) -> str:
         """키를 카테고리별로 분류합니다"""
-        if key.lower() in ['ctrl', 'shift', 'alt', 'win']:
-            return "수식키"
-        elif key.lower() in ['f1', 'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8', 'f9', 'f10', 'f11', 'f12']:
-            return "기능키"
-        elif key.lower() in ['up', 'down', 'left', 'right']:
-            return "화살표키"
-        elif key.lower() in ['space', 'enter', 'escape', 'tab', 'backspace', 'delete']:
-            return "특수키"
-        elif key.isalpha():
-            return "문자키"
-        elif key.isdigit():
-            return "숫자키"
-        else:
-            return "기타키"
+        return _categorize_key(key)
     
-    def _assess_complexity(self, ast: ASTNode) -> str:
+    def _assess_complexity(self, stats: AstStats) -> str:
         """스크립트의 복잡도를 평가합니다"""
-        node_count = self._count_nodes(ast)
-        operators = set(self._find_operators(ast))
+        node_count = stats.node_count
+        operators = stats.operators
         
         if node_count <= 3 and len(operators) <= 1:
             return "초급"
@@ -445,120 +705,56 @@ class ExplainTool:
         else:
             return "고급"
     
-    def _analyze_operators(self, ast: ASTNode) -> Dict[str, Any]:
+    def _analyze_operators(self, stats: AstStats) -> Dict[str, Any]:
         """연산자 사용 패턴을 분석합니다"""
-        operators = self._find_operators(ast)
-        operator_count = {}
-        
-        for op in operators:
-            operator_count[op] = operator_count.get(op, 0) + 1
+        operators = stats.operators
         
         return {
-            "used_operators": list(set(operators)),
-            "operator_frequency": operator_count,
-            "operator_descriptions": {op: self.operator_descriptions.get(op, op) for op in set(operators)}
+            "used_operators": list(operators),
+            "operator_frequency": dict(operators),
+            "operator_descriptions": {op: self.operator_descriptions.get(op, op) for op in operators}
         }
     
-    def _analyze_timing_detailed(self, ast: ASTNode) -> Dict[str, Any]:
+    def _analyze_timing_detailed(self, stats: AstStats) -> Dict[str, Any]:
         """상세한 타이밍 분석을 수행합니다"""
         return {
-            "has_delays": self._has_delays(ast),
-            "has_concurrent": self._has_concurrent_actions(ast),
-            "has_holds": self._has_holds(ast),
-            "estimated_duration": self._calculate_total_time(ast),
-            "timing_complexity": self._assess_timing_complexity(ast)
+            "has_delays": stats.has_delays,
+            "has_concurrent": stats.has_concurrent,
+            "has_holds": stats.has_holds,
+            "estimated_duration": stats.total_time,
+            "timing_complexity": self._assess_timing_complexity(stats)
         }
     
-    def _suggest_optimizations(self, ast: ASTNode) -> List[str]:
+    def _suggest_optimizations(self, stats: AstStats) -> List[str]:
         """최적화 제안을 생성합니다"""
         suggestions = []
         
         # 불필요한 대기 시간 검사
-        if self._has_excessive_delays(ast):
+        if stats.has_excessive_delays:
             suggestions.append("일부 대기 시간이 너무 길 수 있습니다. 최적화를 고려해보세요.")
         
         # 중복 동작 검사
-        if self._has_redundant_actions(ast):
+        if self._has_redundant_actions(stats):
             suggestions.append("중복된 동작이 있습니다. 구조를 단순화할 수 있습니다.")
         
         return suggestions
     
-    def _suggest_alternatives(self, ast: ASTNode) -> List[str]:
+    def _suggest_alternatives(self, stats: AstStats) -> List[str]:
         """대안적 접근법을 제안합니다"""
         alternatives = []
         
         # 복잡한 시퀀스에 대한 대안 제안
-        if self._is_complex_sequence(ast):
+        if self._is_complex_sequence(stats):
             alternatives.append("복잡한 순차 실행을 더 간단한 동시 실행으로 변경할 수 있는지 검토해보세요.")
         
         return alternatives
     
     # 유틸리티 메서드들
-    def _calculate_total_time(self, node: ASTNode) -> float:
-        """총 예상 실행 시간을 계산합니다 (밀리초)"""
-        if isinstance(node, DelayNode):
-            return float(node.delay)
-        elif isinstance(node, SequenceNode):
-            # 순차 실행은 시간을 더함
-            left_time = self._calculate_total_time(node.left) if node.left else 0
-            right_time = self._calculate_total_time(node.right) if node.right else 0
-            return left_time + right_time
-        elif isinstance(node, ConcurrentNode):
-            # 동시 실행은 더 긴 시간을 선택
-            left_time = self._calculate_total_time(node.left) if node.left else 0
-            right_time = self._calculate_total_time(node.right) if node.right else 0
-            return max(left_time, right_time)
-        elif isinstance(node, RepeatNode):
-            # 반복은 내용 시간 × 반복 횟수
-            child_time = 0
-            if hasattr(node, 'children') and node.children:
-                child_time = sum(self._calculate_total_time(child) for child in node.children)
-            return child_time * node.count
-        else:
-            # 기본 키 입력은 50ms로 가정
-            return 50.0
-    
-    def _find_delays(self, node: ASTNode) -> List[Dict[str, Any]]:
-        """딜레이 노드들을 찾습니다"""
-        delays = []
-        
-        if isinstance(node, DelayNode):
-            delays.append({
-                "delay": node.delay,
-                "description": f"{node.delay}ms 대기"
-            })
-        
-        # 자식 노드들에서 재귀적으로 찾기
-        if hasattr(node, 'left') and node.left:
-            delays.extend(self._find_delays(node.left))
-        if hasattr(node, 'right') and node.right:
-            delays.extend(self._find_delays(node.right))
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                delays.extend(self._find_delays(child))
-        
-        return delays
-    
-    def _find_concurrent_actions(self, node: ASTNode) -> List[str]:
-        """동시 실행 동작들을 찾습니다"""
-        concurrent = []
-        
-        if isinstance(node, ConcurrentNode):
-            concurrent.append("동시 실행 발견")
-        
-        # 자식 노드들에서 재귀적으로 찾기
-        if hasattr(node, 'left') and node.left:
-            concurrent.extend(self._find_concurrent_actions(node.left))
-        if hasattr(node, 'right') and node.right:
-            concurrent.extend(self._find_concurrent_actions(node.right))
-        
-        return concurrent
-    
-    def _assess_timing_criticality(self, node: ASTNode) -> str:
+    def _assess_timing_criticality(self, stats: AstStats) -> str:
         """타이밍 중요도를 평가합니다"""
-        has_delays = self._has_delays(node)
-        has_concurrent = self._has_concurrent_actions(node)
-        has_holds = self._has_holds(node)
+        has_delays = stats.has_delays
+        has_concurrent = stats.has_concurrent
+        has_holds = stats.has_holds
         
         if has_delays and has_concurrent and has_holds:
             return "매우 높음"
@@ -569,90 +765,19 @@ class ExplainTool:
         else:
             return "낮음"
     
-    def _has_delays(self, node: ASTNode) -> bool:
-        """딜레이가 있는지 확인합니다"""
-        if isinstance(node, DelayNode):
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_delays(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_delays(node.right):
-            return True
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                if self._has_delays(child):
-                    return True
-        
-        return False
-    
-    def _has_concurrent_actions(self, node: ASTNode) -> bool:
-        """동시 실행이 있는지 확인합니다"""
-        if isinstance(node, ConcurrentNode):
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_concurrent_actions(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_concurrent_actions(node.right):
-            return True
-        
-        return False
-    
-    def _has_repeats(self, node: ASTNode) -> bool:
-        """반복이 있는지 확인합니다"""
-        if isinstance(node, RepeatNode):
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_repeats(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_repeats(node.right):
-            return True
-        
-        return False
-    
-    def _has_holds(self, node: ASTNode) -> bool:
-        """홀드가 있는지 확인합니다"""
-        if isinstance(node, HoldNode):
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_holds(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_holds(node.right):
-            return True
-        
-        return False
-    
-    def _has_excessive_delays(self, node: ASTNode) -> bool:
-        """과도한 딜레이가 있는지 확인합니다 (1초 이상)"""
-        if isinstance(node, DelayNode) and node.delay > 1000:
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_excessive_delays(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_excessive_delays(node.right):
-            return True
-        
-        return False
-    
-    def _has_redundant_actions(self, node: ASTNode) -> bool:
+    def _has_redundant_actions(self, stats: AstStats) -> bool:
         """중복 동작이 있는지 확인합니다 (간단한 휴리스틱)"""
-        # 동일한 키가 연속으로 나오는지 확인
-        keys = []
-        self._collect_key_sequence(node, keys)
-        
-        for i in range(len(keys) - 1):
-            if keys[i] == keys[i + 1]:
-                return True
-        
-        return False
+        # 동일한 키가 연속으로 나오는지 확인 (키 시퀀스를 모을 때 함께 검사됨)
+        return stats.has_repeated_keys
     
-    def _is_complex_sequence(self, node: ASTNode) -> bool:
+    def _is_complex_sequence(self, stats: AstStats) -> bool:
         """복잡한 시퀀스인지 확인합니다"""
-        return self._count_nodes(node) > 10
+        return stats.node_count > 10
     
-    def _assess_timing_complexity(self, node: ASTNode) -> str:
+    def _assess_timing_complexity(self, stats: AstStats) -> str:
         """타이밍 복잡도를 평가합니다"""
-        delay_count = len(self._find_delays(node))
-        concurrent_count = len(self._find_concurrent_actions(node))
+        delay_count = len(stats.delays)
+        concurrent_count = stats.concurrent_count
         
         total_complexity = delay_count + concurrent_count
         
@@ -663,4 +788,26 @@ class ExplainTool:
         elif total_complexity <= 5:
             return "복잡"
         else:
-            return "매우 복잡" 
\ No newline at end of file
+            return "매우 복잡" 
+
+
+# 캐시된 설명을 계산하는 모듈 수준 인스턴스. 설명 헬퍼는 인스턴스 상태를 쓰지 않으므로
+# 캐시 키에 도구 인스턴스를 넣지 않고 이 인스턴스 하나로 계산합니다.
+_EXPLAINER = ExplainMSLTool()
+
+
+@functools.lru_cache(maxsize=256)
+def _explain_cached(script: str, detail_level: str) -> Mapping[str, Any]:
+    """
+    스크립트 설명 결과를 (스크립트, 설명 상세도)별로 캐시합니다.
+    설명은 스크립트와 상세도만으로 결정되므로 반복 요청은 어휘 분석부터 다시 하지 않습니다.
+    여러 호출 측이 같은 결과를 공유하므로 읽기 전용 구조로 고정해 둡니다.
+    
+    Args:
+        script (str): 분석할 MSL 스크립트
+        detail_level (str): 설명 상세도
+        
+    Returns:
+        Mapping[str, Any]: 읽기 전용 설명 결과 (MappingProxyType/tuple)
+    """
+    return freeze(_EXPLAINER._explain(script, detail_level))
@@ -6,23 +6,256 @@ OpenAI GPT API를 활용하여 정확하고 효율적인 MSL 스크립트를 생
 """
 
 import asyncio
+import functools
+import hashlib
 import json
-import traceback
-from typing import Dict, Any, List, Optional
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from mcp.types import TextContent, Tool
 
-from ..msl.msl_lexer import MSLLexer
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 from ..msl.msl_parser import MSLParser
-from ..ai.openai_integration import get_openai_integration
+from ..ai.openai_integration import OPENAI_MODEL, get_openai_integration
+
+logger = logging.getLogger(__name__)
+
+# 생성 스크립트 검증용 파서 (모든 인스턴스가 공유).
+# parse()는 호출마다 토큰과 위치를 다시 설정하고 이벤트 루프 스레드에서만 동기적으로 호출되므로
+# 호출이 겹치지 않습니다.
+_PARSER = MSLParser()
+
+# MSL 패턴 데이터베이스 (모든 인스턴스가 공유하는 읽기 전용 사전)
+MSL_PATTERNS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "common_combos": MappingProxyType({
+        "copy_paste": "ctrl+c, ctrl+v",
+        "select_all": "ctrl+a",
+        "save": "ctrl+s",
+        "undo": "ctrl+z"
+    }),
+    "gaming_patterns": MappingProxyType({
+        "attack_combo": "q, w, e",
+        "movement": "w, a, s, d",
+        "quick_skill": "q+shift"
+    })
+})
+
+# 프롬프트의 일반적인 키 표현 → MSL 키
+KEY_PATTERNS = {
+    "컨트롤c": "ctrl+c",
+    "컨트롤v": "ctrl+v", 
+    "컨트롤a": "ctrl+a",
+    "컨트롤z": "ctrl+z",
+    "컨트롤s": "ctrl+s",
+    "엔터": "enter",
+    "스페이스": "space",
+    "백스페이스": "backspace",
+    "탭": "tab",
+    "시프트": "shift",
+    "알트": "alt",
+    "공격": "q",
+    "스킬": "w",
+    "이동": "wasd",
+    "점프": "space"
+}
+
+# 모든 키 표현을 한 번에 찾는 패턴. 전방 탐색으로 겹치는 표현("백스페이스" 안의 "스페이스")도 찾습니다.
+# 같은 위치에서 시작하는 표현이 여럿이면 긴 것부터 시도합니다.
+_KEY_PATTERN_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(KEY_PATTERNS, key=len, reverse=True))) + "))"
+)
+# 생성 결과 끝에 붙는 다음 단계 안내
+NEXT_STEPS_TEXT = (
+    "🚀 다음 단계:\n"
+    "• parse_msl: 생성된 스크립트 상세 분석\n"
+    "• validate_msl: 추가 검증 수행\n"
+    "• optimize_msl: 성능 최적화\n"
+    "• explain_msl: 상세한 동작 설명"
+)
+
+# 생성 결과 설명에 쓰는 연산자별 문구 (표시 순서대로)
+OPERATOR_EXPLANATIONS = (
+    ("+", "• 키들을 동시에 누릅니다\n"),
+    (",", "• 키들을 순차적으로 누릅니다\n"),
+    ("*", "• 지정된 횟수만큼 반복 실행됩니다\n"),
+    (">", "• 키를 일정 시간 동안 누르고 있습니다\n"),
+    ("&", "• 키 입력 간격이 조정됩니다\n"),
+)
+
+# 마우스 클릭 표현 (그룹 이름이 MSL 마우스 동작)
+_CLICK_RE = re.compile("(?P<lclick>좌클릭|왼쪽클릭)|(?P<rclick>우클릭|오른쪽클릭)")
+
+# 타이밍 표현 (그룹 이름이 타이밍 태그)과 여러 개가 있을 때의 우선순위
+_TIMING_RE = re.compile("(?P<fast>빠르게)|(?P<slow>천천히)|(?P<delay>지연|대기)")
+TIMING_PRECEDENCE = ("fast", "slow", "delay")
+
+_NUMBER_RE = re.compile(r'\d+')
+_SIMULTANEOUS_RE = re.compile("동시에|함께|같이")
+_REPEAT_RE = re.compile("연속|계속|반복")
+_HOLD_RE = re.compile("누르고 있|홀드")
 
+# OpenAI 생성 결과 캐시 (메모리 LRU → 디스크 순으로 조회)
+GENERATION_CACHE_MAX_SIZE = 1024
+# 캐시된 생성 결과의 유효 기간 (초). 지나면 OpenAI에 다시 요청합니다.
+GENERATION_CACHE_TTL = 7 * 24 * 60 * 60
+# 디스크 캐시는 패키지 밖의 사용자 캐시 디렉터리에 둡니다 (MSL_GENERATION_CACHE_DIR로 변경 가능)
+GENERATION_CACHE_DIR = os.path.expanduser(
+    os.environ.get("MSL_GENERATION_CACHE_DIR") or os.path.join("~", ".cache", "msl_gen")
+)
+
+# 캐시 키 → (생성 스크립트, 만료 시각(time.time() 기준))
+_generation_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_generation_disk_cache = None
+
+# 디스크 캐시를 열 수 없었음을 나타내는 표시 (다시 시도하거나 경고를 반복하지 않습니다)
+_DISK_CACHE_UNAVAILABLE = object()
+
+# 디스크 캐시는 워커 스레드에서 열리므로 한 번만 열리도록 잠급니다
+_disk_cache_lock = threading.Lock()
+
+# OpenAI 응답을 기다리는 최대 시간 (초). 넘으면 패턴 매칭 결과를 사용하고,
+# 늦게 도착한 응답은 캐시에만 저장되어 다음 같은 요청에 쓰입니다.
+OPENAI_GENERATION_TIMEOUT = 10.0
+
+# 실행 중인 OpenAI 생성 요청 (같은 프롬프트/컨텍스트가 동시에 들어오면 한 번만 호출합니다)
+_pending_generations: "Dict[str, asyncio.Future[Dict[str, Any]]]" = {}
+
+
+def _generation_cache_key(prompt: str, context: Dict[str, Any]) -> str:
+    """
+    프롬프트와 생성 컨텍스트를 정규화한 SHA-256 캐시 키를 만듭니다.
+    모델이 바뀌면 이전 모델의 결과를 쓰지 않도록 모델 이름도 컨텍스트에 넣어 해시합니다.
+    """
+    context = {**context, "model": OPENAI_MODEL}
+    payload = json.dumps({"prompt": prompt, "context": context}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _get_generation_disk_cache():
+    """
+    생성 결과용 디스크 캐시를 반환합니다. 처음 호출될 때 생성됩니다.
+    
+    Returns:
+        Optional[diskcache.Cache]: 디스크 캐시 (diskcache가 없거나 열 수 없으면 None)
+    """
+    global _generation_disk_cache
+    if _generation_disk_cache is None and diskcache is not None:
+        with _disk_cache_lock:
+            if _generation_disk_cache is None:
+                try:
+                    _generation_disk_cache = diskcache.Cache(GENERATION_CACHE_DIR)
+                except Exception as e:
+                    logger.warning("생성 결과 디스크 캐시를 열 수 없습니다: %s", e)
+                    _generation_disk_cache = _DISK_CACHE_UNAVAILABLE
+    if _generation_disk_cache is _DISK_CACHE_UNAVAILABLE:
+        return None
+    return _generation_disk_cache
 
-class GenerateTool:
+
+def _read_disk_generation(key: str) -> Tuple[Optional[str], Optional[float]]:
+    """디스크 캐시에서 (생성 스크립트, 만료 시각)을 읽습니다 (동기, 워커 스레드에서 호출)."""
+    disk_cache = _get_generation_disk_cache()
+    if disk_cache is None:
+        return None, None
+    return disk_cache.get(key, expire_time=True)
+
+
+def _write_disk_generation(key: str, script: str):
+    """생성 스크립트를 디스크 캐시에 씁니다 (동기, 워커 스레드에서 호출)."""
+    disk_cache = _get_generation_disk_cache()
+    if disk_cache is not None:
+        disk_cache.set(key, script, expire=GENERATION_CACHE_TTL)
+
+
+async def _get_cached_generation(key: str) -> Optional[str]:
+    """
+    캐시된 생성 스크립트를 반환합니다. 디스크에서 찾으면 메모리 캐시로 올립니다.
+    디스크 캐시(SQLite) 접근은 이벤트 루프를 막지 않도록 스레드에서 수행합니다.
+    """
+    entry = _generation_cache.get(key)
+    if entry is not None:
+        script, expires_at = entry
+        if expires_at > time.time():
+            _generation_cache.move_to_end(key)
+            return script
+        del _generation_cache[key]
+    
+    if diskcache is None:
+        return None
+    # 디스크 캐시는 만료된 항목을 돌려주지 않습니다
+    script, expires_at = await asyncio.get_running_loop().run_in_executor(None, _read_disk_generation, key)
+    if script is not None:
+        _store_cached_generation(key, script, expires_at)
+    return script
+
+
+async def _request_generation(cache_key: str, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """OpenAI로 MSL 스크립트 생성을 요청하고, 성공하면 결과를 캐시에 저장합니다."""
+    openai_integration = await get_openai_integration()
+    # 스크립트만 필요하므로 응답의 스크립트 필드가 완성되면 바로 스트림을 닫습니다
+    result = await openai_integration.generate_msl_script_streaming(prompt=prompt, context=context)
+    if result.get("msl_script") and not result.get("error"):
+        _store_cached_generation(cache_key, result["msl_script"])
+        if diskcache is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, _write_disk_generation, cache_key, result["msl_script"]
+            )
+    return result
+
+
+def _generate_shared(cache_key: str, prompt: str, context: Dict[str, Any]) -> "asyncio.Future[Dict[str, Any]]":
+    """
+    같은 캐시 키의 생성 요청이 이미 실행 중이면 그 작업을, 아니면 새 작업을 반환합니다.
+    작업은 완료되면 스스로 실행 중 목록에서 빠지므로 기다리던 쪽이 포기해도 계속 진행됩니다.
+    """
+    pending = _pending_generations.get(cache_key)
+    if pending is not None:
+        return pending
+    
+    task = asyncio.ensure_future(_request_generation(cache_key, prompt, context))
+    _pending_generations[cache_key] = task
+    task.add_done_callback(functools.partial(_finish_generation, cache_key))
+    return task
+
+
+def _finish_generation(cache_key: str, task: "asyncio.Future[Dict[str, Any]]"):
+    """완료된 생성 작업을 실행 중 목록에서 제거합니다."""
+    _pending_generations.pop(cache_key, None)
+    if not task.cancelled():
+        # 시간 초과로 아무도 기다리지 않는 작업의 예외가 경고로 남지 않도록 확인합니다
+        task.exception()
+
+
+def _store_cached_generation(key: str, script: str, expires_at: Optional[float] = None):
+    """
+    생성 스크립트를 메모리 캐시에 저장합니다. 가장 오래된 항목부터 제거합니다.
+    만료 시각이 없으면 지금부터 GENERATION_CACHE_TTL 뒤에 만료됩니다.
+    """
+    if expires_at is None:
+        expires_at = time.time() + GENERATION_CACHE_TTL
+    _generation_cache[key] = (script, expires_at)
+    _generation_cache.move_to_end(key)
+    if len(_generation_cache) > GENERATION_CACHE_MAX_SIZE:
+        _generation_cache.popitem(last=False)
+
+
+class GenerateMSLTool:
     """MSL 스크립트 자동 생성 도구"""
     
+    __slots__ = ("parser", "msl_patterns")
+    
     def __init__(self):
-        self.lexer = MSLLexer()
-        self.parser = MSLParser()
-        self.msl_patterns = self._load_msl_patterns()
+        self.parser = _PARSER
+        self.msl_patterns = MSL_PATTERNS
     
     @property
     def tool_definition(self) -> Tool:
@@ -88,23 +321,23 @@ class GenerateTool:
                 )]
             
             # 1. 프롬프트 분석 및 MSL 패턴 매칭
-            analysis_result = await self._analyze_prompt(prompt, game_context, complexity)
+            analysis_result = self._analyze_prompt(prompt, game_context, complexity)
             analysis_result["original_prompt"] = prompt
             
             # 2. MSL 스크립트 생성
             msl_script = await self._generate_msl_script(analysis_result)
             
             # 3. 생성된 스크립트 검증
-            validation_result = await self._validate_generated_script(msl_script)
+            validation_result = self._validate_generated_script(msl_script)
             
             if not validation_result["valid"]:
                 # 검증 실패 시 재생성 시도
-                msl_script = await self._fix_script_errors(msl_script, validation_result["errors"])
-                validation_result = await self._validate_generated_script(msl_script)
+                msl_script = self._fix_script_errors(msl_script, validation_result["errors"])
+                validation_result = self._validate_generated_script(msl_script)
             
             # 4. 최적화 (요청된 경우)
             if optimize and validation_result["valid"]:
-                msl_script = await self._optimize_script(msl_script)
+                msl_script = self._optimize_script(msl_script)
             
             # 5. 결과 포맷팅
             result = self._format_generation_result(
@@ -114,12 +347,17 @@ class GenerateTool:
             
             return [TextContent(type="text", text=result)]
             
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 취소된 요청은 오류 응답을 만들지 않습니다
+            raise
         except Exception as e:
+            # 실패한 경우에만 필요하므로 여기서 가져옵니다
+            import traceback
             error_msg = f"❌ MSL 생성 도구 실행 중 오류가 발생했습니다:\n{str(e)}\n\n"
             error_msg += f"스택 트레이스:\n{traceback.format_exc()}"
             return [TextContent(type="text", text=error_msg)]
     
-    async def _analyze_prompt(self, prompt: str, game_context: str, complexity: str) -> Dict[str, Any]:
+    def _analyze_prompt(self, prompt: str, game_context: str, complexity: str) -> Dict[str, Any]:
         """프롬프트를 분석하여 MSL 생성에 필요한 정보를 추출합니다."""
         
         # 키워드 기반 패턴 매칭
@@ -130,63 +368,42 @@ class GenerateTool:
             "modifiers": [],
             "mouse_actions": [],
             "special_features": [],
-            "estimated_complexity": complexity
-        }
-        
-        # 일반적인 키 패턴 인식
-        key_patterns = {
-            "컨트롤c": "ctrl+c",
-            "컨트롤v": "ctrl+v", 
-            "컨트롤a": "ctrl+a",
-            "컨트롤z": "ctrl+z",
-            "컨트롤s": "ctrl+s",
-            "엔터": "enter",
-            "스페이스": "space",
-            "백스페이스": "backspace",
-            "탭": "tab",
-            "시프트": "shift",
-            "알트": "alt",
-            "공격": "q",
-            "스킬": "w",
-            "이동": "wasd",
-            "점프": "space"
+            "estimated_complexity": complexity,
+            "game_context": game_context
         }
         
         # 동작 타입 인식
-        if "동시에" in prompt or "함께" in prompt or "같이" in prompt:
+        if _SIMULTANEOUS_RE.search(prompt):
             analysis["action_type"] = "simultaneous"
-        elif "연속" in prompt or "계속" in prompt or "반복" in prompt:
+        elif _REPEAT_RE.search(prompt):
             analysis["action_type"] = "repeat"
-        elif "누르고 있" in prompt or "홀드" in prompt:
+        elif _HOLD_RE.search(prompt):
             analysis["action_type"] = "hold"
         
-        # 키 추출
-        for korean, msl_key in key_patterns.items():
-            if korean in prompt.lower():
-                analysis["keys"].append(msl_key)
+        # 키 추출 (프롬프트를 한 번만 훑고, 결과는 KEY_PATTERNS 순서로 정리)
+        found = {match.group(1) for match in _KEY_PATTERN_RE.finditer(prompt.lower())}
+        if found:
+            analysis["keys"] = [msl_key for korean, msl_key in KEY_PATTERNS.items() if korean in found]
         
         # 숫자 추출 (반복 횟수 등)
-        import re
-        numbers = re.findall(r'\d+', prompt)
-        if numbers:
-            analysis["repeat_count"] = int(numbers[0])
+        number = _NUMBER_RE.search(prompt)
+        if number:
+            analysis["repeat_count"] = int(number.group())
         
         # 마우스 동작 인식
         if "클릭" in prompt:
-            if "좌클릭" in prompt or "왼쪽클릭" in prompt:
+            clicks = {match.lastgroup for match in _CLICK_RE.finditer(prompt)}
+            if "lclick" in clicks:
                 analysis["mouse_actions"].append("lclick")
-            if "우클릭" in prompt or "오른쪽클릭" in prompt:
+            if "rclick" in clicks:
                 analysis["mouse_actions"].append("rclick")
-            if "클릭" in prompt and "좌" not in prompt and "우" not in prompt:
+            if "좌" not in prompt and "우" not in prompt:
                 analysis["mouse_actions"].append("lclick")
         
-        # 타이밍 정보
-        if "빠르게" in prompt:
-            analysis["timing"].append("fast")
-        elif "천천히" in prompt:
-            analysis["timing"].append("slow")
-        elif "지연" in prompt or "대기" in prompt:
-            analysis["timing"].append("delay")
+        # 타이밍 정보 (한 번 훑은 뒤 빠르게 > 천천히 > 지연/대기 순으로 하나만 사용)
+        timing_tags = {match.lastgroup for match in _TIMING_RE.finditer(prompt)}
+        if timing_tags:
+            analysis["timing"].append(next(tag for tag in TIMING_PRECEDENCE if tag in timing_tags))
         
         return analysis
     
@@ -195,87 +412,52 @@ class GenerateTool:
         
         # OpenAI 통합을 시도하되, 실패시 기본 패턴 매칭 사용
         try:
-            openai_integration = await get_openai_integration()
             prompt = analysis.get("original_prompt", "")
             
             if prompt:
-                # OpenAI로 MSL 생성 시도
-                result = await openai_integration.generate_msl_from_prompt(
-                    prompt=prompt,
-                    context={
-                        "complexity": analysis.get("estimated_complexity", "medium"),
-                        "game_context": analysis.get("game_context", ""),
-                        "action_type": analysis.get("action_type", "sequential")
-                    }
-                )
+                context = {
+                    "complexity": analysis.get("estimated_complexity", "medium"),
+                    "game_context": analysis.get("game_context", ""),
+                    "action_type": analysis.get("action_type", "sequential")
+                }
+                
+                # 같은 프롬프트/컨텍스트로 생성한 적이 있으면 API를 호출하지 않습니다
+                cache_key = _generation_cache_key(prompt, context)
+                cached_script = await _get_cached_generation(cache_key)
+                if cached_script is not None:
+                    return cached_script
+                
+                # OpenAI로 MSL 생성 시도 (동시에 들어온 같은 요청과 결과를 공유)
+                task = _generate_shared(cache_key, prompt, context)
+                try:
+                    result = await asyncio.wait_for(asyncio.shield(task), OPENAI_GENERATION_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning("OpenAI 응답이 %.1f초 안에 오지 않아 기본 방식 사용", OPENAI_GENERATION_TIMEOUT)
+                    result = {}
                 
                 if result.get("msl_script") and not result.get("error"):
                     return result["msl_script"]
         except Exception as e:
             # OpenAI 실패시 기본 방식으로 폴백
-            print(f"OpenAI 생성 실패, 기본 방식 사용: {e}")
+            logger.warning("OpenAI 생성 실패, 기본 방식 사용: %s", e)
         
         # 기본 패턴 매칭 방식으로 폴백
-        action_type = analysis["action_type"]
-        keys = analysis["keys"]
-        mouse_actions = analysis["mouse_actions"]
-        repeat_count = analysis.get("repeat_count", 1)
-        timing = analysis["timing"]
-        
-        # 기본 키/마우스 액션 결합
-        actions = keys + mouse_actions
-        
-        if not actions:
-            return "# 인식된 키/마우스 액션이 없습니다"
-        
-        # 액션 타입에 따른 MSL 스크립트 생성
-        if action_type == "simultaneous":
-            # 동시 실행: +로 연결
-            script = "+".join(actions)
-            
-        elif action_type == "repeat":
-            # 반복 실행: *로 반복
-            base_script = ",".join(actions) if len(actions) > 1 else actions[0]
-            script = f"({base_script})*{repeat_count}"
-            
-        elif action_type == "hold":
-            # 홀드 실행: >로 홀드
-            base_script = ",".join(actions) if len(actions) > 1 else actions[0]
-            hold_time = 1000  # 기본 1초
-            script = f"{base_script} > {hold_time}"
-            
-        else:  # sequential
-            # 순차 실행: ,로 연결
-            script = ",".join(actions)
-        
-        # 타이밍 조정
-        if "fast" in timing:
-            script = f"{script} & 50"  # 50ms 간격
-        elif "slow" in timing:
-            script = f"{script} & 500"  # 500ms 간격
-        elif "delay" in timing:
-            script = f"(200), {script}"  # 200ms 지연
-        
-        return script
+        return self._pattern_generate(analysis)
+    
+    def _pattern_generate(self, analysis: Dict[str, Any]) -> str:
+        """키워드 분석 결과로 기본 MSL 스크립트를 만듭니다 (OpenAI를 쓸 수 없을 때 사용)."""
+        return _build_pattern_script(
+            analysis["action_type"],
+            tuple(analysis["keys"]) + tuple(analysis["mouse_actions"]),
+            analysis.get("repeat_count", 1),
+            tuple(analysis["timing"])
+        )
     
-    async def _validate_generated_script(self, script: str) -> Dict[str, Any]:
+    def _validate_generated_script(self, script: str) -> Dict[str, Any]:
         """생성된 MSL 스크립트를 검증합니다."""
-        try:
-            # 파싱 시도
-            ast = self.parser.parse(script)
-            return {
-                "valid": True,
-                "errors": [],
-                "warnings": []
-            }
-        except Exception as e:
-            return {
-                "valid": False,
-                "errors": [str(e)],
-                "warnings": []
-            }
+        return dict(_validate_script_cached(script))
     
-    async def _fix_script_errors(self, script: str, errors: List[str]) -> str:
+    def _fix_script_errors(self, script: str, errors: List[str]) -> str:
         """스크립트 오류를 수정합니다."""
         # 간단한 오류 수정 로직
         fixed_script = script
@@ -292,8 +474,12 @@ class GenerateTool:
         
         return fixed_script
     
-    async def _optimize_script(self, script: str) -> str:
+    def _optimize_script(self, script: str) -> str:
         """MSL 스크립트를 최적화합니다."""
+        # 이미 정리된 스크립트(대부분의 AI 생성 결과)는 그대로 반환합니다
+        if ",," not in script and not (script[:1].isspace() or script[-1:].isspace()):
+            return script
+        
         # 기본적인 최적화 로직
         optimized = script
         
@@ -310,78 +496,130 @@ class GenerateTool:
                                 validation: Dict, include_explanation: bool) -> str:
         """생성 결과를 포맷팅합니다."""
         
-        result = "🎯 MSL 스크립트 생성 완료!\n\n"
-        result += f"📝 입력 프롬프트: '{prompt}'\n\n"
+        # 조각을 모아 마지막에 한 번만 이어 붙입니다
+        parts = ["🎯 MSL 스크립트 생성 완료!\n\n", f"📝 입력 프롬프트: '{prompt}'\n\n"]
+        append = parts.append
         
         # 생성된 스크립트
-        result += "🔧 생성된 MSL 스크립트:\n"
-        result += f"```msl\n{script}\n```\n\n"
+        append("🔧 생성된 MSL 스크립트:\n")
+        append(f"```msl\n{script}\n```\n\n")
         
         # 검증 결과
         if validation["valid"]:
-            result += "✅ 스크립트 검증: 성공\n"
+            append("✅ 스크립트 검증: 성공\n")
         else:
-            result += "⚠️ 스크립트 검증: 일부 오류 있음\n"
+            append("⚠️ 스크립트 검증: 일부 오류 있음\n")
             for error in validation["errors"]:
-                result += f"  • {error}\n"
-        result += "\n"
+                append(f"  • {error}\n")
+        append("\n")
         
         if include_explanation:
             # 분석 정보
-            result += "📊 분석 정보:\n"
-            result += f"• 동작 타입: {analysis['action_type']}\n"
-            result += f"• 인식된 키: {', '.join(analysis['keys']) if analysis['keys'] else '없음'}\n"
-            result += f"• 마우스 동작: {', '.join(analysis['mouse_actions']) if analysis['mouse_actions'] else '없음'}\n"
+            append("📊 분석 정보:\n")
+            append(f"• 동작 타입: {analysis['action_type']}\n")
+            append(f"• 인식된 키: {', '.join(analysis['keys']) if analysis['keys'] else '없음'}\n")
+            append(f"• 마우스 동작: {', '.join(analysis['mouse_actions']) if analysis['mouse_actions'] else '없음'}\n")
             if analysis.get('repeat_count'):
-                result += f"• 반복 횟수: {analysis['repeat_count']}회\n"
-            result += "\n"
+                append(f"• 반복 횟수: {analysis['repeat_count']}회\n")
+            append("\n")
             
             # 스크립트 설명
-            result += "💡 스크립트 설명:\n"
-            result += self._explain_script(script)
-            result += "\n"
+            append("💡 스크립트 설명:\n")
+            append(self._explain_script(script))
+            append("\n")
         
         # 다음 단계 안내
-        result += "🚀 다음 단계:\n"
-        result += "• parse_msl: 생성된 스크립트 상세 분석\n"
-        result += "• validate_msl: 추가 검증 수행\n"
-        result += "• optimize_msl: 성능 최적화\n"
-        result += "• explain_msl: 상세한 동작 설명"
+        append(NEXT_STEPS_TEXT)
         
-        return result
+        return "".join(parts)
     
     def _explain_script(self, script: str) -> str:
         """스크립트의 동작을 설명합니다."""
-        explanation = ""
-        
-        if "+" in script:
-            explanation += "• 키들을 동시에 누릅니다\n"
-        if "," in script:
-            explanation += "• 키들을 순차적으로 누릅니다\n"
-        if "*" in script:
-            explanation += "• 지정된 횟수만큼 반복 실행됩니다\n"
-        if ">" in script:
-            explanation += "• 키를 일정 시간 동안 누르고 있습니다\n"
-        if "&" in script:
-            explanation += "• 키 입력 간격이 조정됩니다\n"
+        # 스크립트를 한 번만 훑어 사용된 문자를 모읍니다
+        used_chars = set(script)
+        explanation = "".join(
+            text for operator, text in OPERATOR_EXPLANATIONS if operator in used_chars
+        )
         
         if not explanation:
             explanation = "• 기본적인 키 입력을 수행합니다\n"
         
         return explanation
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_script_cached(script: str) -> Dict[str, Any]:
+    """
+    스크립트 파싱 결과를 스크립트별로 캐시합니다. 오류 수정이나 최적화 후에도
+    스크립트가 그대로인 경우가 많아 같은 스크립트를 다시 파싱하지 않도록 합니다.
     
-    def _load_msl_patterns(self) -> Dict[str, Any]:
-        """MSL 패턴 데이터베이스를 로드합니다."""
+    Args:
+        script (str): 검증할 MSL 스크립트
+        
+    Returns:
+        Dict[str, Any]: 검증 결과 (호출 측에서 수정하지 않아야 합니다)
+    """
+    try:
+        # 파싱 시도
+        _PARSER.parse(script)
         return {
-            "common_combos": {
-                "copy_paste": "ctrl+c, ctrl+v",
-                "select_all": "ctrl+a",
-                "save": "ctrl+s",
-                "undo": "ctrl+z"
-            },
-            "gaming_patterns": {
-                "attack_combo": "q, w, e",
-                "movement": "w, a, s, d",
-                "quick_skill": "q+shift"
-            }
-        } 
\ No newline at end of file
+            "valid": True,
+            "errors": [],
+            "warnings": []
+        }
+    except Exception as e:
+        return {
+            "valid": False,
+            "errors": [str(e)],
+            "warnings": []
+        }
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_pattern_script(action_type: str, actions: Tuple[str, ...], repeat_count: int,
+                          timing: Tuple[str, ...]) -> str:
+    """
+    동작 타입, 키/마우스 액션, 반복 횟수, 타이밍으로 기본 MSL 스크립트를 만듭니다.
+    입력이 같으면 결과도 같으므로 조합별로 캐시합니다.
+    
+    Args:
+        action_type (str): sequential, simultaneous, hold, repeat 중 하나
+        actions (Tuple[str, ...]): 키 다음에 마우스 동작 순서의 액션
+        repeat_count (int): 반복 횟수
+        timing (Tuple[str, ...]): 타이밍 태그 (fast, slow, delay)
+        
+    Returns:
+        str: 생성된 MSL 스크립트
+    """
+    if not actions:
+        return "# 인식된 키/마우스 액션이 없습니다"
+    
+    # 액션 타입에 따른 MSL 스크립트 생성
+    if action_type == "simultaneous":
+        # 동시 실행: +로 연결
+        script = "+".join(actions)
+        
+    elif action_type == "repeat":
+        # 반복 실행: *로 반복
+        base_script = ",".join(actions) if len(actions) > 1 else actions[0]
+        script = f"({base_script})*{repeat_count}"
+        
+    elif action_type == "hold":
+        # 홀드 실행: >로 홀드
+        base_script = ",".join(actions) if len(actions) > 1 else actions[0]
+        hold_time = 1000  # 기본 1초
+        script = f"{base_script} > {hold_time}"
+        
+    else:  # sequential
+        # 순차 실행: ,로 연결
+        script = ",".join(actions)
+    
+    # 타이밍 조정
+    if "fast" in timing:
+        script = f"{script} & 50"  # 50ms 간격
+    elif "slow" in timing:
+        script = f"{script} & 500"  # 500ms 간격
+    elif "delay" in timing:
+        script = f"(200), {script}"  # 200ms 지연
+    
+    return script
@@ -6,23 +6,110 @@ MSL 스크립트의 성능을 최적화하고 효율성을 개선하는 도구
 """
 
 import asyncio
+import functools
+import itertools
 import json
+import os
 import traceback
 import re
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from mcp.types import TextContent, Tool
 
-from ..msl.msl_lexer import MSLLexer
+from ..msl.msl_lexer import LexerError, MSLLexer
 from ..msl.msl_parser import MSLParser
 
+# 이 길이(문자 수) 이상의 스크립트는 이벤트 루프 밖의 스레드에서 검증/최적화합니다
+OFFLOAD_SCRIPT_LENGTH = 2000
 
-class OptimizeTool:
+# 도구 오류 응답에 스택 트레이스를 포함할지 여부 (MSL_DEBUG=true 일 때만 포함)
+INCLUDE_TRACEBACK = os.environ.get("MSL_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
+
+# 스키마에 정의된 최적화 수준/목표 (모든 조합의 단계 목록을 미리 만들어 둡니다)
+OPTIMIZATION_LEVELS = ("basic", "standard", "aggressive")
+TARGET_PERFORMANCES = ("speed", "stability", "balanced")
+
+# 최적화 단계: 스크립트를 받아 (최적화된 스크립트, 적용된 최적화 목록)을 반환
+OptimizationStage = Callable[[str], Tuple[str, List[str]]]
+
+# 공백 정리와 중복 쉼표 제거를 한 번에 처리합니다. 바꿔야 하는 부분만 매칭하며
+# (두 칸 이상의 공백, 공백 이외의 공백 문자, 두 개 이상의 쉼표) 그룹 이름이 치환 문자열을 고릅니다.
+_NORMALIZE_RE = re.compile(r'(?P<space>\s{2,}|[^\S ])|(?P<comma>,{2,})')
+_NORMALIZED_TEXT = {"space": " ", "comma": ","}
+
+# 연속 키 통합에서 제외하는 복잡한 표현식의 연산자/괄호
+_COMPLEX_EXPRESSION_RE = re.compile(r'[()+>&*]')
+
+# 타이밍 최적화에 쓰는 간격 표현 ("& 5", "& 120")
+_SHORT_INTERVAL_RE = re.compile(r'&\s*([1-9])\b')
+_INTERVAL_RE = re.compile(r'&\s*(\d+)')
+
+# 실행 시간 추정에 쓰는 숫자 인자 (반복 "*3", 간격 "& 50", 홀드 "> 300")를 한 번에 찾습니다.
+# 연산자 문자별 ms 가중치: 반복 1회당 20ms, 간격/홀드는 값 그대로
+_TIMED_ARGUMENT_RE = re.compile(r'(\*|&\s*|>\s*)(\d+)')
+_TIMED_ARGUMENT_WEIGHTS = {"*": 20, "&": 1, ">": 1}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(script: str) -> Tuple[Optional[int], bool]:
+    """
+    스크립트를 토큰화하고 파싱한 결과를 캐시합니다.
+    원본/최적화 스크립트의 검증과 토큰 수 비교가 같은 결과를 재사용합니다.
+    토큰 수와 유효 여부만 쓰이므로 토큰 객체와 AST는 캐시에 남기지 않습니다.
+    
+    Args:
+        script (str): MSL 스크립트
+        
+    Returns:
+        Tuple: (토큰 수, 유효 여부). 토큰화에 실패하면 (None, False)입니다.
+    """
+    try:
+        token_count = len(MSLLexer(script).tokenize())
+    except LexerError:
+        return None, False
+    return token_count, MSLParser().try_parse(script) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _script_metrics(script: str) -> Tuple[int, int]:
+    """
+    스크립트의 복잡도 점수와 예상 실행 시간(ms)을 계산합니다.
+    같은 원본 스크립트를 다른 수준/목표로 다시 최적화할 때 결과를 재사용합니다.
+    
+    Args:
+        script (str): MSL 스크립트
+        
+    Returns:
+        Tuple[int, int]: (복잡도 점수, 예상 실행 시간 ms)
+    """
+    # 복잡도 점수 (간단한 휴리스틱)
+    complexity = len(script) // 10  # 길이 기반
+    complexity += script.count('(') * 2  # 괄호 중첩
+    complexity += script.count('*') * 3  # 반복 구조
+    complexity += script.count('&') * 2  # 타이밍 제어
+    
+    # 예상 실행 시간: 기본 100ms + 키 수에 따른 시간 증가
+    execution_time = 100 + (script.count(',') + 1) * 10
+    
+    # 반복, 타이밍 제어, 홀드 시간에 따른 시간 증가 (한 번의 탐색)
+    for operator, value in _TIMED_ARGUMENT_RE.findall(script):
+        execution_time += int(value) * _TIMED_ARGUMENT_WEIGHTS[operator[0]]
+    
+    return complexity, execution_time
+
+
+class OptimizeMSLTool:
     """MSL 스크립트 최적화 도구"""
     
+    __slots__ = ("optimization_rules", "pipelines")
+    
     def __init__(self):
-        self.lexer = MSLLexer()
-        self.parser = MSLParser()
         self.optimization_rules = self._load_optimization_rules()
+        self.pipelines = {
+            (level, target, preserve_timing): self._build_pipeline(level, target, preserve_timing)
+            for level in OPTIMIZATION_LEVELS
+            for target in TARGET_PERFORMANCES
+            for preserve_timing in (False, True)
+        }
     
     @property
     def tool_definition(self) -> Tool:
@@ -85,8 +172,14 @@ class OptimizeTool:
                          "• optimize_msl(script='ctrl+c, ctrl+v', optimization_level='aggressive')"
                 )]
             
+            # 긴 스크립트는 파싱과 최적화가 이벤트 루프를 막지 않도록 스레드에서 수행
+            loop = asyncio.get_running_loop() if len(script) >= OFFLOAD_SCRIPT_LENGTH else None
+            
             # 원본 스크립트 검증
-            original_valid = await self._validate_script(script)
+            if loop is None:
+                original_valid = self._validate_script(script)
+            else:
+                original_valid = await loop.run_in_executor(None, self._validate_script, script)
             if not original_valid:
                 return [TextContent(
                     type="text",
@@ -95,9 +188,15 @@ class OptimizeTool:
                 )]
             
             # 최적화 수행
-            optimization_result = await self._perform_optimization(
-                script, optimization_level, preserve_timing, target_performance
-            )
+            if loop is None:
+                optimization_result = self._perform_optimization(
+                    script, optimization_level, preserve_timing, target_performance
+                )
+            else:
+                optimization_result = await loop.run_in_executor(
+                    None, self._perform_optimization,
+                    script, optimization_level, preserve_timing, target_performance
+                )
             
             # 결과 포맷팅
             result = self._format_optimization_result(
@@ -107,92 +206,95 @@ class OptimizeTool:
             return [TextContent(type="text", text=result)]
             
         except Exception as e:
-            error_msg = f"❌ MSL 최적화 도구 실행 중 오류가 발생했습니다:\n{str(e)}\n\n"
-            error_msg += f"스택 트레이스:\n{traceback.format_exc()}"
+            error_msg = f"❌ MSL 최적화 도구 실행 중 오류가 발생했습니다:\n{str(e)}"
+            if INCLUDE_TRACEBACK:
+                error_msg += f"\n\n스택 트레이스:\n{traceback.format_exc()}"
             return [TextContent(type="text", text=error_msg)]
     
-    async def _perform_optimization(self, script: str, level: str, preserve_timing: bool, 
-                                  target: str) -> Dict[str, Any]:
+    def _perform_optimization(self, script: str, level: str, preserve_timing: bool, 
+                            target: str) -> Dict[str, Any]:
         """최적화를 수행합니다."""
         
-        optimization_result = {
-            "original_script": script,
-            "optimized_script": script,
-            "level": level,
-            "target": target,
-            "optimizations_applied": [],
-            "performance_improvement": {},
-            "warnings": [],
-            "errors": []
-        }
+        warnings = []
+        errors = []
+        performance_improvement = {}
         
         try:
+            # 1~4. 수준/목표/타이밍 보존 조합별로 미리 만든 단계를 순서대로 적용
+            pipeline = self.pipelines.get((level, target, bool(preserve_timing)))
+            if pipeline is None:
+                pipeline = self._build_pipeline(level, target, bool(preserve_timing))
+            
             optimized = script
             applied_optimizations = []
+            for stage in pipeline:
+                optimized, stage_opts = stage(optimized)
+                applied_optimizations.extend(stage_opts)
             
-            # 1. 기본 최적화 (모든 수준에서 적용)
-            optimized, basic_opts = await self._apply_basic_optimizations(optimized)
-            applied_optimizations.extend(basic_opts)
-            
-            # 2. 표준 최적화 (standard, aggressive)
-            if level in ["standard", "aggressive"]:
-                optimized, standard_opts = await self._apply_standard_optimizations(
-                    optimized, preserve_timing
-                )
-                applied_optimizations.extend(standard_opts)
-            
-            # 3. 적극적 최적화 (aggressive만)
-            if level == "aggressive":
-                optimized, aggressive_opts = await self._apply_aggressive_optimizations(
-                    optimized, target
-                )
-                applied_optimizations.extend(aggressive_opts)
-            
-            # 4. 타겟별 특화 최적화
-            optimized, target_opts = await self._apply_target_specific_optimizations(
-                optimized, target
-            )
-            applied_optimizations.extend(target_opts)
-            
-            # 5. 최적화 결과 검증
-            optimized_valid = await self._validate_script(optimized)
-            if not optimized_valid:
-                optimization_result["warnings"].append("최적화된 스크립트에 오류가 발생했습니다. 원본을 반환합니다.")
+            # 5. 최적화 결과 검증 (바뀌지 않았으면 execute에서 이미 검증한 원본이므로 생략)
+            if optimized != script and not self._validate_script(optimized):
+                warnings.append("최적화된 스크립트에 오류가 발생했습니다. 원본을 반환합니다.")
                 optimized = script
                 applied_optimizations = ["최적화 실패로 인한 원본 유지"]
             
             # 성능 개선 분석
-            performance_improvement = await self._analyze_performance_improvement(
+            performance_improvement = self._analyze_performance_improvement(
                 script, optimized
             )
             
-            optimization_result.update({
-                "optimized_script": optimized,
-                "optimizations_applied": applied_optimizations,
-                "performance_improvement": performance_improvement
-            })
-            
         except Exception as e:
-            optimization_result["errors"].append(f"최적화 중 오류 발생: {str(e)}")
-            optimization_result["optimized_script"] = script
+            errors.append(f"최적화 중 오류 발생: {str(e)}")
+            optimized = script
+            applied_optimizations = []
         
-        return optimization_result
+        return {
+            "original_script": script,
+            "optimized_script": optimized,
+            "level": level,
+            "target": target,
+            "optimizations_applied": applied_optimizations,
+            "performance_improvement": performance_improvement,
+            "warnings": warnings,
+            "errors": errors
+        }
+    
+    def _build_pipeline(self, level: str, target: str, preserve_timing: bool) -> List[OptimizationStage]:
+        """최적화 수준, 목표, 타이밍 보존 여부에 맞는 최적화 단계 목록을 만듭니다."""
+        # 1. 기본 최적화 (모든 수준에서 적용)
+        pipeline = [self._apply_basic_optimizations]
+        
+        # 2. 표준 최적화 (standard, aggressive)
+        if level in ["standard", "aggressive"]:
+            pipeline.append(functools.partial(
+                self._apply_standard_optimizations, preserve_timing=preserve_timing
+            ))
+        
+        # 3. 적극적 최적화 (aggressive만)
+        if level == "aggressive":
+            pipeline.append(functools.partial(self._apply_aggressive_optimizations, target=target))
+        
+        # 4. 타겟별 특화 최적화 (balanced는 이미 적용된 최적화들의 균형으로 처리)
+        if target in ["speed", "stability"]:
+            pipeline.append(functools.partial(self._apply_target_specific_optimizations, target=target))
+        
+        return pipeline
     
-    async def _apply_basic_optimizations(self, script: str) -> Tuple[str, List[str]]:
+    def _apply_basic_optimizations(self, script: str) -> Tuple[str, List[str]]:
         """기본 최적화를 적용합니다."""
-        optimized = script
         applied = []
         
-        # 1. 공백 정리
-        original_optimized = optimized
-        optimized = re.sub(r'\s+', ' ', optimized.strip())
-        if optimized != original_optimized:
-            applied.append("불필요한 공백 제거")
+        # 1~2. 공백 정리와 중복 쉼표 제거 (한 번의 치환)
+        stripped = script.strip()
+        normalized_kinds = set()
         
-        # 2. 중복 쉼표 제거
-        original_optimized = optimized
-        optimized = re.sub(r',+', ',', optimized)
-        if optimized != original_optimized:
+        def normalize(match: re.Match) -> str:
+            normalized_kinds.add(match.lastgroup)
+            return _NORMALIZED_TEXT[match.lastgroup]
+        
+        optimized = _NORMALIZE_RE.sub(normalize, stripped)
+        if stripped != script or "space" in normalized_kinds:
+            applied.append("불필요한 공백 제거")
+        if "comma" in normalized_kinds:
             applied.append("중복 쉼표 제거")
         
         # 3. 연속된 동일한 키 통합
@@ -203,7 +305,7 @@ class OptimizeTool:
         
         return optimized, applied
     
-    async def _apply_standard_optimizations(self, script: str, preserve_timing: bool) -> Tuple[str, List[str]]:
+    def _apply_standard_optimizations(self, script: str, preserve_timing: bool) -> Tuple[str, List[str]]:
         """표준 최적화를 적용합니다."""
         optimized = script
         applied = []
@@ -229,7 +331,7 @@ class OptimizeTool:
         
         return optimized, applied
     
-    async def _apply_aggressive_optimizations(self, script: str, target: str) -> Tuple[str, List[str]]:
+    def _apply_aggressive_optimizations(self, script: str, target: str) -> Tuple[str, List[str]]:
         """적극적 최적화를 적용합니다."""
         optimized = script
         applied = []
@@ -255,7 +357,7 @@ class OptimizeTool:
         
         return optimized, applied
     
-    async def _apply_target_specific_optimizations(self, script: str, target: str) -> Tuple[str, List[str]]:
+    def _apply_target_specific_optimizations(self, script: str, target: str) -> Tuple[str, List[str]]:
         """타겟별 특화 최적화를 적용합니다."""
         optimized = script
         applied = []
@@ -278,27 +380,30 @@ class OptimizeTool:
         
         return optimized, applied
     
-    async def _analyze_performance_improvement(self, original: str, optimized: str) -> Dict[str, Any]:
+    def _analyze_performance_improvement(self, original: str, optimized: str) -> Dict[str, Any]:
         """성능 개선을 분석합니다."""
         
+        # 최적화로 바뀐 것이 없으면 최적화 스크립트의 메트릭은 원본과 같으므로 다시 계산하지 않습니다
+        unchanged = optimized == original
+        
         # 기본 메트릭 계산
         original_length = len(original)
         optimized_length = len(optimized)
         length_reduction = original_length - optimized_length
         
         # 토큰 수 비교
-        original_tokens = len(list(self.lexer.tokenize(original)))
-        optimized_tokens = len(list(self.lexer.tokenize(optimized)))
+        original_tokens = self._token_count(original)
+        optimized_tokens = original_tokens if unchanged else self._token_count(optimized)
         token_reduction = original_tokens - optimized_tokens
         
         # 복잡도 점수 계산 (간단한 휴리스틱)
         original_complexity = self._calculate_complexity_score(original)
-        optimized_complexity = self._calculate_complexity_score(optimized)
+        optimized_complexity = original_complexity if unchanged else self._calculate_complexity_score(optimized)
         complexity_improvement = original_complexity - optimized_complexity
         
         # 예상 실행 시간 개선
         original_exec_time = self._estimate_execution_time(original)
-        optimized_exec_time = self._estimate_execution_time(optimized)
+        optimized_exec_time = original_exec_time if unchanged else self._estimate_execution_time(optimized)
         time_improvement = original_exec_time - optimized_exec_time
         
         return {
@@ -323,13 +428,16 @@ class OptimizeTool:
             }
         }
     
-    async def _validate_script(self, script: str) -> bool:
+    def _token_count(self, script: str) -> int:
+        """스크립트의 토큰 수를 반환합니다 (토큰화 결과는 캐시됨)."""
+        token_count = _parse_cached(script)[0]
+        if token_count is None:
+            raise ValueError("스크립트를 토큰화할 수 없습니다")
+        return token_count
+    
+    def _validate_script(self, script: str) -> bool:
         """스크립트가 유효한지 검증합니다."""
-        try:
-            ast = self.parser.parse(script)
-            return True
-        except:
-            return False
+        return _parse_cached(script)[1]
     
     def _merge_consecutive_identical_keys(self, script: str) -> str:
         """연속된 동일한 키를 통합합니다."""
@@ -339,30 +447,13 @@ class OptimizeTool:
             return script
         
         optimized_parts = []
-        current_key = parts[0].strip()
-        count = 1
-        
-        for i in range(1, len(parts)):
-            key = parts[i].strip()
-            if key == current_key and not self._is_complex_expression(key):
-                count += 1
+        for key, group in itertools.groupby(part.strip() for part in parts):
+            count = sum(1 for _ in group)
+            if count > 2 and not self._is_complex_expression(key):
+                optimized_parts.append(f"({key})*{count}")
             else:
-                if count > 2:
-                    optimized_parts.append(f"({current_key})*{count}")
-                elif count == 2:
-                    optimized_parts.extend([current_key, current_key])
-                else:
-                    optimized_parts.append(current_key)
-                current_key = key
-                count = 1
-        
-        # 마지막 키 처리
-        if count > 2:
-            optimized_parts.append(f"({current_key})*{count}")
-        elif count == 2:
-            optimized_parts.extend([current_key, current_key])
-        else:
-            optimized_parts.append(current_key)
+                # 복잡한 표현식과 2개 이하의 반복은 그대로 둡니다
+                optimized_parts.extend([key] * count)
         
         return ','.join(optimized_parts)
     
@@ -374,7 +465,7 @@ class OptimizeTool:
     def _optimize_timing(self, script: str) -> str:
         """타이밍을 최적화합니다."""
         # 불필요하게 짧은 간격을 적절한 수준으로 조정
-        optimized = re.sub(r'&\s*([1-9])\b', r'& 10', script)  # 10ms 미만을 10ms로
+        optimized = _SHORT_INTERVAL_RE.sub(r'& 10', script)  # 10ms 미만을 10ms로
         return optimized
     
     def _optimize_grouping(self, script: str) -> str:
@@ -397,52 +488,26 @@ class OptimizeTool:
     def _optimize_for_speed(self, script: str) -> str:
         """속도를 위해 최적화합니다."""
         # 간격을 줄이고 병렬 처리를 증가
-        optimized = re.sub(r'&\s*(\d+)', lambda m: f"& {max(10, int(m.group(1)) // 2)}", script)
+        optimized = _INTERVAL_RE.sub(lambda m: f"& {max(10, int(m.group(1)) // 2)}", script)
         return optimized
     
     def _optimize_for_stability(self, script: str) -> str:
         """안정성을 위해 최적화합니다."""
         # 간격을 늘리고 안전한 구조 사용
-        optimized = re.sub(r'&\s*(\d+)', lambda m: f"& {max(50, int(m.group(1)) * 2)}", script)
+        optimized = _INTERVAL_RE.sub(lambda m: f"& {max(50, int(m.group(1)) * 2)}", script)
         return optimized
     
     def _calculate_complexity_score(self, script: str) -> int:
         """복잡도 점수를 계산합니다."""
-        score = 0
-        score += len(script) // 10  # 길이 기반
-        score += script.count('(') * 2  # 괄호 중첩
-        score += script.count('*') * 3  # 반복 구조
-        score += script.count('&') * 2  # 타이밍 제어
-        return score
+        return _script_metrics(script)[0]
     
     def _estimate_execution_time(self, script: str) -> int:
         """예상 실행 시간을 밀리초로 추정합니다."""
-        base_time = 100  # 기본 100ms
-        
-        # 키 수에 따른 시간 증가
-        key_count = script.count(',') + 1
-        base_time += key_count * 10
-        
-        # 반복에 따른 시간 증가
-        for match in re.finditer(r'\*(\d+)', script):
-            repeat_count = int(match.group(1))
-            base_time += repeat_count * 20
-        
-        # 타이밍 제어에 따른 시간 증가
-        for match in re.finditer(r'&\s*(\d+)', script):
-            interval = int(match.group(1))
-            base_time += interval
-        
-        # 홀드 시간 추가
-        for match in re.finditer(r'>\s*(\d+)', script):
-            hold_time = int(match.group(1))
-            base_time += hold_time
-        
-        return base_time
+        return _script_metrics(script)[1]
     
     def _is_complex_expression(self, expr: str) -> bool:
         """표현식이 복잡한지 확인합니다."""
-        return any(char in expr for char in ['(', ')', '+', '>', '&', '*'])
+        return _COMPLEX_EXPRESSION_RE.search(expr) is not None
     
     def _format_optimization_result(self, original: str, optimization_result: Dict[str, Any], 
                                   show_diff: bool) -> str:
@@ -452,70 +517,72 @@ class OptimizeTool:
         applied = optimization_result["optimizations_applied"]
         performance = optimization_result["performance_improvement"]
         
-        result = "🚀 MSL 스크립트 최적화 완료!\n\n"
+        # 조각을 모아 마지막에 한 번만 이어 붙입니다
+        parts = ["🚀 MSL 스크립트 최적화 완료!\n\n"]
+        append = parts.append
         
         # 원본과 최적화된 스크립트
-        result += f"📝 원본 스크립트: '{original}'\n"
-        result += f"✨ 최적화 스크립트: '{optimized}'\n\n"
+        append(f"📝 원본 스크립트: '{original}'\n")
+        append(f"✨ 최적화 스크립트: '{optimized}'\n\n")
         
         # 적용된 최적화
         if applied:
-            result += "🔧 적용된 최적화:\n"
+            append("🔧 적용된 최적화:\n")
             for opt in applied:
-                result += f"  • {opt}\n"
+                append(f"  • {opt}\n")
         else:
-            result += "🔧 적용된 최적화: 없음 (이미 최적화됨)\n"
-        result += "\n"
+            append("🔧 적용된 최적화: 없음 (이미 최적화됨)\n")
+        append("\n")
         
         # 성능 개선 정보
         if performance:
-            result += "📊 성능 개선 분석:\n"
+            append("📊 성능 개선 분석:\n")
             
             # 길이 개선
             length_improve = performance["length_reduction"]
             if length_improve["absolute"] > 0:
-                result += f"  📏 길이 감소: {length_improve['absolute']}자 ({length_improve['percentage']}%)\n"
+                append(f"  📏 길이 감소: {length_improve['absolute']}자 ({length_improve['percentage']}%)\n")
             
             # 토큰 개선
             token_improve = performance["token_reduction"]
             if token_improve["absolute"] > 0:
-                result += f"  🎯 토큰 감소: {token_improve['absolute']}개 ({token_improve['percentage']}%)\n"
+                append(f"  🎯 토큰 감소: {token_improve['absolute']}개 ({token_improve['percentage']}%)\n")
             
             # 복잡도 개선
             complexity = performance["complexity_improvement"]
             if complexity["improvement"] > 0:
-                result += f"  🧠 복잡도 개선: {complexity['original_score']} → {complexity['optimized_score']}\n"
+                append(f"  🧠 복잡도 개선: {complexity['original_score']} → {complexity['optimized_score']}\n")
             
             # 실행 시간 개선
             exec_time = performance["execution_time_improvement"]
             if exec_time["improvement_ms"] > 0:
-                result += f"  ⚡ 실행 시간 개선: {exec_time['improvement_ms']}ms ({exec_time['improvement_percentage']}%)\n"
+                append(f"  ⚡ 실행 시간 개선: {exec_time['improvement_ms']}ms ({exec_time['improvement_percentage']}%)\n")
             
             if all(perf["absolute"] == 0 or perf.get("improvement", 0) == 0 for perf in [length_improve, token_improve]):
-                result += "  ℹ️ 이미 잘 최적화된 스크립트입니다.\n"
-            result += "\n"
+                append("  ℹ️ 이미 잘 최적화된 스크립트입니다.\n")
+            append("\n")
         
         # 차이점 표시
         if show_diff and original != optimized:
-            result += "🔍 주요 변경사항:\n"
+            append("🔍 주요 변경사항:\n")
             if len(original) > len(optimized):
-                result += f"  • 스크립트 길이가 {len(original) - len(optimized)}자 단축되었습니다\n"
+                append(f"  • 스크립트 길이가 {len(original) - len(optimized)}자 단축되었습니다\n")
             
             # 구체적인 변경사항 분석
             if "*" in optimized and "*" not in original:
-                result += f"  • 반복 패턴이 최적화되었습니다\n"
+                append(f"  • 반복 패턴이 최적화되었습니다\n")
             if "(" in optimized and "(" not in original:
-                result += f"  • 그룹화가 추가되었습니다\n"
+                append(f"  • 그룹화가 추가되었습니다\n")
             
-            result += "\n"
+            append("\n")
         
         # 다음 단계 안내
-        result += "🚀 다음 단계:\n"
-        result += "• validate_msl: 최적화된 스크립트 검증\n"
-        result += "• explain_msl: 최적화된 스크립트 설명\n"
-        result += "• parse_msl: 상세한 구조 분석"
+        append("🚀 다음 단계:\n")
+        append("• validate_msl: 최적화된 스크립트 검증\n")
+        append("• explain_msl: 최적화된 스크립트 설명\n")
+        append("• parse_msl: 상세한 구조 분석")
         
-        return result
+        return "".join(parts)
     
     def _load_optimization_rules(self) -> Dict[str, Any]:
         """최적화 규칙을 로드합니다."""
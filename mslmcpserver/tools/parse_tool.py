@@ -7,6 +7,7 @@ MSL 스크립트를 파싱하고 AST(Abstract Syntax Tree)로 변환하는 도
 
 import asyncio
 import json
+import os
 import traceback
 from typing import Dict, Any, List, Optional
 from mcp.types import TextContent, Tool
@@ -14,12 +15,27 @@ from mcp.types import TextContent, Tool
 from ..msl.msl_lexer import MSLLexer  
 from ..msl.msl_parser import MSLParser
 
+# 이 길이(문자 수) 이상의 스크립트는 이벤트 루프 밖의 스레드에서 파싱합니다
+OFFLOAD_SCRIPT_LENGTH = 2000
 
-class ParseTool:
+# 도구 오류 응답에 스택 트레이스를 포함할지 여부 (MSL_DEBUG=true 일 때만 포함)
+INCLUDE_TRACEBACK = os.environ.get("MSL_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
+
+# AST 트리 출력용 들여쓰기 문자열 (노드마다 새로 만들지 않도록 미리 만들어 둡니다)
+_INDENTS = tuple(" " * width for width in range(128))
+
+
+def _indent(width: int) -> str:
+    """width 칸짜리 들여쓰기 문자열을 반환합니다."""
+    return _INDENTS[width] if width < len(_INDENTS) else " " * width
+
+
+class ParseMSLTool:
     """MSL 스크립트 파싱 도구"""
     
+    __slots__ = ("parser",)
+    
     def __init__(self):
-        self.lexer = MSLLexer()
         self.parser = MSLParser()
     
     @property
@@ -70,7 +86,7 @@ class ParseTool:
             
             # 1. 어휘 분석 (토큰화)
             try:
-                tokens = self.lexer.tokenize(script)
+                tokens = MSLLexer(script).tokenize()
                 token_list = list(tokens)  # 이터레이터를 리스트로 변환
             except Exception as e:
                 return [TextContent(
@@ -84,7 +100,7 @@ class ParseTool:
             if validate_only:
                 try:
                     # 파서로 구문 검증
-                    ast = self.parser.parse(script)
+                    ast = await self._parse(script)
                     return [TextContent(
                         type="text",
                         text=f"✅ 구문 검증 성공!\n\n"
@@ -102,7 +118,7 @@ class ParseTool:
             
             # 2. 구문 분석 (파싱)
             try:
-                ast = self.parser.parse(script)
+                ast = await self._parse(script)
             except Exception as e:
                 return [TextContent(
                     type="text",
@@ -117,87 +133,103 @@ class ParseTool:
             return [TextContent(type="text", text=result)]
             
         except Exception as e:
-            error_msg = f"❌ 파싱 도구 실행 중 예상치 못한 오류가 발생했습니다:\n{str(e)}\n\n"
-            error_msg += f"스택 트레이스:\n{traceback.format_exc()}"
+            error_msg = f"❌ 파싱 도구 실행 중 예상치 못한 오류가 발생했습니다:\n{str(e)}"
+            if INCLUDE_TRACEBACK:
+                error_msg += f"\n\n스택 트레이스:\n{traceback.format_exc()}"
             return [TextContent(type="text", text=error_msg)]
     
+    async def _parse(self, script: str):
+        """스크립트를 파싱합니다. 긴 스크립트는 이벤트 루프를 막지 않도록 스레드에서 파싱합니다."""
+        if len(script) < OFFLOAD_SCRIPT_LENGTH:
+            return self.parser.parse(script)
+        
+        # 공유 파서는 파싱 중에 상태를 바꾸므로 스레드에서는 새 파서를 사용합니다
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, MSLParser().parse, script)
+    
     def _format_parse_result(self, script: str, tokens: List, ast, verbose: bool) -> str:
         """파싱 결과를 포맷팅합니다."""
-        result = "✅ MSL 스크립트 파싱 성공!\n\n"
-        result += f"📝 입력 스크립트: '{script}'\n\n"
+        
+        # 조각을 모아 마지막에 한 번만 이어 붙입니다
+        parts = ["✅ MSL 스크립트 파싱 성공!\n\n", f"📝 입력 스크립트: '{script}'\n\n"]
+        append = parts.append
         
         # 기본 정보
-        result += f"📊 파싱 정보:\n"
-        result += f"• 토큰 수: {len(tokens)}개\n"
-        result += f"• AST 노드 타입: {type(ast).__name__}\n\n"
+        append(f"📊 파싱 정보:\n")
+        append(f"• 토큰 수: {len(tokens)}개\n")
+        append(f"• AST 노드 타입: {type(ast).__name__}\n\n")
         
         if verbose:
             # 상세 토큰 정보
-            result += "🔍 토큰 분석 (상세):\n"
+            append("🔍 토큰 분석 (상세):\n")
             for i, token in enumerate(tokens, 1):
-                result += f"  {i:2d}. {token.type:<12} | '{token.value}'"
+                append(f"  {i:2d}. {token.type:<12} | '{token.value}'")
                 if hasattr(token, 'lineno'):
-                    result += f" | 줄:{token.lineno}"
+                    append(f" | 줄:{token.lineno}")
                 if hasattr(token, 'column'):
-                    result += f" | 열:{token.column}"
-                result += "\n"
-            result += "\n"
+                    append(f" | 열:{token.column}")
+                append("\n")
+            append("\n")
             
             # AST 구조 정보
-            result += "🌳 AST 구조 (상세):\n"
-            result += self._format_ast_tree(ast, indent=2)
-            result += "\n"
+            append("🌳 AST 구조 (상세):\n")
+            self._format_ast_tree(ast, 2, parts)
+            append("\n")
         else:
             # 간단한 토큰 정보
-            result += "🔍 토큰 요약:\n"
+            append("🔍 토큰 요약:\n")
             token_types = {}
             for token in tokens:
                 token_types[token.type] = token_types.get(token.type, 0) + 1
             
             for token_type, count in token_types.items():
-                result += f"  • {token_type}: {count}개\n"
-            result += "\n"
+                append(f"  • {token_type}: {count}개\n")
+            append("\n")
         
         # 파싱 결과 요약
-        result += "📋 파싱 요약:\n"
-        result += f"• 상태: 성공\n"
-        result += f"• 구문 오류: 없음\n"
-        result += f"• 실행 가능: ✅\n\n"
+        append("📋 파싱 요약:\n")
+        append(f"• 상태: 성공\n")
+        append(f"• 구문 오류: 없음\n")
+        append(f"• 실행 가능: ✅\n\n")
         
         # 사용 가능한 다음 단계 안내
-        result += "💡 다음 단계:\n"
-        result += "• validate_msl: 더 상세한 검증 수행\n"
-        result += "• optimize_msl: 스크립트 최적화\n"
-        result += "• explain_msl: 스크립트 동작 설명"
+        append("💡 다음 단계:\n")
+        append("• validate_msl: 더 상세한 검증 수행\n")
+        append("• optimize_msl: 스크립트 최적화\n")
+        append("• explain_msl: 스크립트 동작 설명")
         
-        return result
+        return "".join(parts)
     
-    def _format_ast_tree(self, node, indent: int = 0) -> str:
-        """AST 노드를 트리 형태로 포맷팅합니다."""
+    def _format_ast_tree(self, node, indent: int, out: List[str]) -> None:
+        """AST 노드를 트리 형태로 포맷팅하여 out에 조각을 추가합니다."""
+        append = out.append
+        pad = _indent(indent)
         if node is None:
-            return " " * indent + "None\n"
+            append(pad + "None\n")
+            return
         
-        result = " " * indent + f"{type(node).__name__}\n"
+        append(pad + f"{type(node).__name__}\n")
+        attr_pad = _indent(indent + 2)
+        item_pad = _indent(indent + 4)
         
         # 노드의 속성들을 재귀적으로 출력
         if hasattr(node, '__dict__'):
             for attr_name, attr_value in node.__dict__.items():
-                if attr_name.startswith('_'):
+                # parent는 상위 노드를 가리키므로 따라가면 순환합니다
+                if attr_name.startswith('_') or attr_name == 'parent':
                     continue
                     
-                result += " " * (indent + 2) + f"{attr_name}: "
+                append(attr_pad + f"{attr_name}: ")
                 
                 if isinstance(attr_value, list):
-                    result += f"[{len(attr_value)} items]\n"
+                    append(f"[{len(attr_value)} items]\n")
                     for item in attr_value:
                         if hasattr(item, '__dict__'):  # AST 노드인 경우
-                            result += self._format_ast_tree(item, indent + 4)
+                            self._format_ast_tree(item, indent + 4, out)
                         else:
-                            result += " " * (indent + 4) + f"{repr(item)}\n"
+                            append(item_pad + f"{repr(item)}\n")
                 elif hasattr(attr_value, '__dict__'):  # AST 노드인 경우
-                    result += "\n"
-                    result += self._format_ast_tree(attr_value, indent + 4)
+                    append("\n")
+                    self._format_ast_tree(attr_value, indent + 4, out)
                 else:
-                    result += f"{repr(attr_value)}\n"
-        
-        return result 
\ No newline at end of file
+                    append(f"{repr(attr_value)}\n")
@@ -0,0 +1,27 @@
+"""
+읽기 전용 응답 데이터 헬퍼
+
+도구가 모듈 수준에서 공유하거나 캐시하는 응답 데이터를 읽기 전용 구조로 고정하고,
+호출 측에는 자유롭게 수정할 수 있는 복사본을 돌려줍니다.
+"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def freeze(value: Any) -> Any:
+    """중첩된 dict/list를 읽기 전용 구조(MappingProxyType/tuple)로 바꿉니다"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """읽기 전용 구조(매핑/tuple)를 호출 측이 자유롭게 수정할 수 있는 dict/list 복사본으로 바꿉니다"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
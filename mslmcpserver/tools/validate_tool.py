@@ -15,12 +15,16 @@ from mcp.types import TextContent, Tool
 from ..msl.msl_lexer import MSLLexer
 from ..msl.msl_parser import MSLParser
 
+# 이 길이(문자 수) 이상의 스크립트는 이벤트 루프 밖의 스레드에서 구문 검사합니다
+OFFLOAD_SCRIPT_LENGTH = 2000
 
-class ValidateTool:
+
+class ValidateMSLTool:
     """MSL 스크립트 상세 검증 도구"""
     
+    __slots__ = ("parser", "validation_rules")
+    
     def __init__(self):
-        self.lexer = MSLLexer()
         self.parser = MSLParser()
         self.validation_rules = self._load_validation_rules()
     
@@ -163,7 +167,16 @@ class ValidateTool:
         return validation_result
     
     async def _check_syntax(self, script: str) -> Dict[str, Any]:
-        """구문 검사를 수행합니다."""
+        """구문 검사를 수행합니다. 긴 스크립트는 이벤트 루프를 막지 않도록 스레드에서 검사합니다."""
+        if len(script) < OFFLOAD_SCRIPT_LENGTH:
+            return self._check_syntax_sync(script, self.parser)
+        
+        # 공유 파서는 파싱 중에 상태를 바꾸므로 스레드에서는 새 파서를 사용합니다
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._check_syntax_sync, script, MSLParser())
+    
+    def _check_syntax_sync(self, script: str, parser: MSLParser) -> Dict[str, Any]:
+        """_check_syntax의 동기 구현"""
         result = {
             "valid": False,
             "errors": [],
@@ -174,12 +187,12 @@ class ValidateTool:
         
         try:
             # 토큰화 검사
-            tokens = self.lexer.tokenize(script)
+            tokens = MSLLexer(script).tokenize()
             token_list = list(tokens)
             result["token_count"] = len(token_list)
             
             # 파싱 검사
-            ast = self.parser.parse(script)
+            ast = parser.parse(script)
             result["valid"] = True
             result["ast_info"] = {
                 "type": type(ast).__name__,